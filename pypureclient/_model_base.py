@@ -0,0 +1,194 @@
+"""
+Base class shared by the generated Swagger models.
+
+Models inherit their dunder and serialization methods from `SwaggerModel`
+instead of each carrying its own copy, so a single set of code objects serves
+every model class.
+"""
+
+from types import MappingProxyType
+
+_CANONICAL_MAPPINGS = {}
+
+
+def canonical(mapping):
+    """
+    Returns a read-only view of `mapping`, shared by every model that declares
+    the same items in the same order (e.g. one model across API versions).
+    """
+    key = tuple(mapping.items())
+    shared = _CANONICAL_MAPPINGS.get(key)
+    if shared is None:
+        shared = _CANONICAL_MAPPINGS.setdefault(key, MappingProxyType(dict(mapping)))
+    return shared
+
+
+# Exact types that are serialized as they are; checked first since most
+# model fields hold plain values
+_SCALAR_TYPES = frozenset([str, int, float, bool, type(None)])
+
+
+def _value_to_dict(value):
+    if type(value) in _SCALAR_TYPES:
+        return value
+    to_dict = getattr(value, "to_dict", None)
+    if to_dict is not None:
+        return to_dict()
+    return value
+
+
+def _fields_to_dict(attrs, fields):
+    result = {}
+
+    for attr in attrs:
+        if attr in fields:
+            value = fields[attr]
+            if type(value) in _SCALAR_TYPES:
+                result[attr] = value
+            elif isinstance(value, list):
+                result[attr] = [_value_to_dict(x) for x in value]
+            elif isinstance(value, dict):
+                result[attr] = {k: _value_to_dict(v) for k, v in value.items()}
+            else:
+                result[attr] = _value_to_dict(value)
+
+    return result
+
+
+def _all_fields_to_dict(attrs, fields):
+    result = {}
+
+    for attr in attrs:
+        value = fields.get(attr)
+        if type(value) in _SCALAR_TYPES:
+            result[attr] = value
+        elif isinstance(value, list):
+            result[attr] = [_value_to_dict(x) for x in value]
+        elif isinstance(value, dict):
+            result[attr] = {k: _value_to_dict(v) for k, v in value.items()}
+        else:
+            result[attr] = _value_to_dict(value)
+
+    return result
+
+
+class SwaggerModel(object):
+    """
+    Subclasses define `swagger_types` and `attribute_map` as usual, plus
+    `_ATTRS` (the attribute names in declaration order) and `_ATTR_SET`
+    (the same names as a frozenset). `_VALIDATORS` optionally maps an
+    attribute name to a callable that checks each non-None value assigned
+    to it.
+    """
+
+    _ATTRS = ()
+    _ATTR_SET = frozenset()
+    _VALIDATORS = MappingProxyType({})
+
+    @classmethod
+    def _from_trusted(cls, kwargs):
+        """
+        Builds an instance from values the API client has already deserialized
+        from a server response. Unlike the constructor, the values are stored as
+        they are, without running `_VALIDATORS` again.
+        """
+        instance = cls.__new__(cls)
+        fields = instance.__dict__
+        for key, value in kwargs.items():
+            if value is not None:
+                fields[key] = value
+        return instance
+
+    def __setattr__(self, key, value):
+        if key not in self._ATTR_SET:
+            raise KeyError("Invalid key `{}` for `{}`".format(key, type(self).__name__))
+        validate = self._VALIDATORS.get(key)
+        if validate is not None and value is not None:
+            validate(value)
+        self.__dict__[key] = value
+
+    def __getitem__(self, key):
+        if key not in self._ATTR_SET:
+            raise KeyError("Invalid key `{}` for `{}`".format(key, type(self).__name__))
+        try:
+            return object.__getattribute__(self, key)
+        except AttributeError:
+            # An unset key reads as the class Property, as on the generated models
+            return getattr(type(self), key)
+
+    def __setitem__(self, key, value):
+        if key not in self._ATTR_SET:
+            raise KeyError("Invalid key `{}` for `{}`".format(key, type(self).__name__))
+        object.__setattr__(self, key, value)
+
+    def __delitem__(self, key):
+        if key not in self._ATTR_SET:
+            raise KeyError("Invalid key `{}` for `{}`".format(key, type(self).__name__))
+        object.__delattr__(self, key)
+
+    def keys(self):
+        return self._ATTRS
+
+    def to_dict(self):
+        """Returns the model properties as a dict"""
+        return _fields_to_dict(self._ATTRS, self.__dict__)
+
+    @classmethod
+    def to_dicts(cls, objs):
+        """Returns the model properties of each of the objects as a list of dicts"""
+        attrs = cls._ATTRS
+        return [_fields_to_dict(attrs, obj.__dict__) for obj in objs]
+
+    @classmethod
+    def to_columns(cls, objs):
+        """
+        Returns the attribute values of the objects as a dict mapping each
+        attribute name to a list with one entry per object, None where unset
+        """
+        columns = {attr: [] for attr in cls._ATTRS}
+        appenders = [(attr, columns[attr].append) for attr in cls._ATTRS]
+        for obj in objs:
+            fields = obj.__dict__
+            for attr, append in appenders:
+                append(fields.get(attr))
+        return columns
+
+    def to_str(self):
+        """Returns the string representation of the model"""
+        import pprint
+        return pprint.pformat(self.to_dict())
+
+    def __repr__(self):
+        """For `print` and `pprint`"""
+        return self.to_str()
+
+    def __eq__(self, other):
+        """Returns true if both objects are equal"""
+        if self is other:
+            return True
+        if not isinstance(other, type(self)):
+            return False
+
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        """Returns true if both objects are not equal"""
+        return not self == other
+
+
+class NullableSwaggerModel(SwaggerModel):
+    """
+    A `SwaggerModel` whose unset attributes read as None, as installed by
+    `properties.NullableModelProperty`. `to_dict` reports every attribute,
+    with None for the unset ones.
+    """
+
+    def to_dict(self):
+        """Returns the model properties as a dict"""
+        return _all_fields_to_dict(self._ATTRS, self.__dict__)
+
+    @classmethod
+    def to_dicts(cls, objs):
+        """Returns the model properties of each of the objects as a list of dicts"""
+        attrs = cls._ATTRS
+        return [_all_fields_to_dict(attrs, obj.__dict__) for obj in objs]
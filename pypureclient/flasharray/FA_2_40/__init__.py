@@ -2,8 +2,9 @@ from __future__ import absolute_import
 import os
 
 from .client import Client
+from ... import _model_base
 from ...exceptions import PureError
-from ...properties import Property, Filter
+from ...properties import Property, ModelProperty, Filter
 from ...responses import ValidResponse, ErrorResponse, ApiError, ResponseHeaders
 
 from .models.active_directory_patch import ActiveDirectoryPatch
@@ -460,8 +461,12 @@ from .models.workload_preset import WorkloadPreset
 
 
 def add_properties(model):
+    # Only the SwaggerModel subclasses read their attributes without a
+    # __getattribute__ override, the generated models still expect a plain
+    # Property on the class
+    property_class = ModelProperty if issubclass(model, _model_base.SwaggerModel) else Property
     for name, value in model.attribute_map.items():
-        setattr(model, name, Property(value))
+        setattr(model, name, property_class(value))
 
 
 CLASSES_TO_ADD_PROPS = [
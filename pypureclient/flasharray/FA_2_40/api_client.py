@@ -631,7 +631,11 @@ class ApiClient(object):
                     value = data[klass.attribute_map[attr]]
                     kwargs[attr] = self.__deserialize(value, attr_type)
 
-        instance = klass(**kwargs)
+        from_trusted = getattr(klass, '_from_trusted', None)
+        if from_trusted is not None:
+            instance = from_trusted(kwargs)
+        else:
+            instance = klass(**kwargs)
 
         if (isinstance(instance, dict) and
                 klass.swagger_types is not None and
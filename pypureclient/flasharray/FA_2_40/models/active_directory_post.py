@@ -11,17 +11,13 @@
 """
 
 
-import pprint
-import re
-
-import six
 import typing
 
-from ....properties import Property
+from .... import _model_base
 if typing.TYPE_CHECKING:
     from pypureclient.flasharray.FA_2_40 import models
 
-class ActiveDirectoryPost(object):
+class ActiveDirectoryPost(_model_base.SwaggerModel):
     """
     Attributes:
       swagger_types (dict): The key is attribute name
@@ -29,7 +25,7 @@ class ActiveDirectoryPost(object):
       attribute_map (dict): The key is attribute name
                             and the value is json key in definition.
     """
-    swagger_types = {
+    swagger_types = _model_base.canonical({
         'computer_name': 'str',
         'directory_servers': 'list[str]',
         'domain': 'str',
@@ -38,9 +34,9 @@ class ActiveDirectoryPost(object):
         'user': 'str',
         'join_ou': 'str',
         'tls': 'str'
-    }
+    })
 
-    attribute_map = {
+    attribute_map = _model_base.canonical({
         'computer_name': 'computer_name',
         'directory_servers': 'directory_servers',
         'domain': 'domain',
@@ -49,10 +45,13 @@ class ActiveDirectoryPost(object):
         'user': 'user',
         'join_ou': 'join_ou',
         'tls': 'tls'
-    }
+    })
+
+    _ATTRS = tuple(attribute_map)
+    _ATTR_SET = frozenset(attribute_map)
 
-    required_args = {
-    }
+    required_args = _model_base.canonical({
+    })
 
     def __init__(
         self,
@@ -76,96 +75,20 @@ class ActiveDirectoryPost(object):
             join_ou (str): The distinguished name of the organizational unit in which the computer account should be created when joining the domain. The `DC=...` components of the distinguished name can be optionally omitted. If not specified, defaults to `CN=Computers`.
             tls (str): TLS mode for communication with domain controllers. Valid values are `required` and `optional`. `required` forces TLS communication with a domain controller. `optional` allows the use of non-TLS communication, TLS will still be preferred, if available. If not specified, defaults to `required`.
         """
+        fields = self.__dict__
         if computer_name is not None:
-            self.computer_name = computer_name
+            fields['computer_name'] = computer_name
         if directory_servers is not None:
-            self.directory_servers = directory_servers
+            fields['directory_servers'] = directory_servers
         if domain is not None:
-            self.domain = domain
+            fields['domain'] = domain
         if kerberos_servers is not None:
-            self.kerberos_servers = kerberos_servers
+            fields['kerberos_servers'] = kerberos_servers
         if password is not None:
-            self.password = password
+            fields['password'] = password
         if user is not None:
-            self.user = user
+            fields['user'] = user
         if join_ou is not None:
-            self.join_ou = join_ou
+            fields['join_ou'] = join_ou
         if tls is not None:
-            self.tls = tls
-
-    def __setattr__(self, key, value):
-        if key not in self.attribute_map:
-            raise KeyError("Invalid key `{}` for `ActiveDirectoryPost`".format(key))
-        self.__dict__[key] = value
-
-    def __getattribute__(self, item):
-        value = object.__getattribute__(self, item)
-        if isinstance(value, Property):
-            raise AttributeError
-        else:
-            return value
-
-    def __getitem__(self, key):
-        if key not in self.attribute_map:
-            raise KeyError("Invalid key `{}` for `ActiveDirectoryPost`".format(key))
-        return object.__getattribute__(self, key)
-
-    def __setitem__(self, key, value):
-        if key not in self.attribute_map:
-            raise KeyError("Invalid key `{}` for `ActiveDirectoryPost`".format(key))
-        object.__setattr__(self, key, value)
-
-    def __delitem__(self, key):
-        if key not in self.attribute_map:
-            raise KeyError("Invalid key `{}` for `ActiveDirectoryPost`".format(key))
-        object.__delattr__(self, key)
-
-    def keys(self):
-        return self.attribute_map.keys()
-
-    def to_dict(self):
-        """Returns the model properties as a dict"""
-        result = {}
-
-        for attr, _ in six.iteritems(self.swagger_types):
-            if hasattr(self, attr):
-                value = getattr(self, attr)
-                if isinstance(value, list):
-                    result[attr] = list(map(
-                        lambda x: x.to_dict() if hasattr(x, "to_dict") else x,
-                        value
-                    ))
-                elif hasattr(value, "to_dict"):
-                    result[attr] = value.to_dict()
-                elif isinstance(value, dict):
-                    result[attr] = dict(map(
-                        lambda item: (item[0], item[1].to_dict())
-                        if hasattr(item[1], "to_dict") else item,
-                        value.items()
-                    ))
-                else:
-                    result[attr] = value
-        if issubclass(ActiveDirectoryPost, dict):
-            for key, value in self.items():
-                result[key] = value
-
-        return result
-
-    def to_str(self):
-        """Returns the string representation of the model"""
-        return pprint.pformat(self.to_dict())
-
-    def __repr__(self):
-        """For `print` and `pprint`"""
-        return self.to_str()
-
-    def __eq__(self, other):
-        """Returns true if both objects are equal"""
-        if not isinstance(other, ActiveDirectoryPost):
-            return False
-
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other):
-        """Returns true if both objects are not equal"""
-        return not self == other
+            fields['tls'] = tls
@@ -11,17 +11,13 @@
 """
 
 
-import pprint
-import re
-
-import six
 import typing
 
-from ....properties import Property
+from .... import _model_base
 if typing.TYPE_CHECKING:
     from pypureclient.flasharray.FA_2_40 import models
 
-class Audit(object):
+class Audit(_model_base.SwaggerModel):
     """
     Attributes:
       swagger_types (dict): The key is attribute name
@@ -29,7 +25,7 @@ class Audit(object):
       attribute_map (dict): The key is attribute name
                             and the value is json key in definition.
     """
-    swagger_types = {
+    swagger_types = _model_base.canonical({
         'id': 'str',
         'name': 'str',
         'context': 'FixedReference',
@@ -40,9 +36,9 @@ class Audit(object):
         'user': 'str',
         'origin': 'FixedReference',
         'user_interface': 'str'
-    }
+    })
 
-    attribute_map = {
+    attribute_map = _model_base.canonical({
         'id': 'id',
         'name': 'name',
         'context': 'context',
@@ -53,10 +49,13 @@ class Audit(object):
         'user': 'user',
         'origin': 'origin',
         'user_interface': 'user_interface'
-    }
+    })
+
+    _ATTRS = tuple(attribute_map)
+    _ATTR_SET = frozenset(attribute_map)
 
-    required_args = {
-    }
+    required_args = _model_base.canonical({
+    })
 
     def __init__(
         self,
@@ -84,100 +83,24 @@ class Audit(object):
             origin (FixedReference): The array from which the command originated.
             user_interface (str): The user interface through which the user session event was performed. Valid values are `CLI`, `GUI`, and `REST`.
         """
+        fields = self.__dict__
         if id is not None:
-            self.id = id
+            fields['id'] = id
         if name is not None:
-            self.name = name
+            fields['name'] = name
         if context is not None:
-            self.context = context
+            fields['context'] = context
         if arguments is not None:
-            self.arguments = arguments
+            fields['arguments'] = arguments
         if command is not None:
-            self.command = command
+            fields['command'] = command
         if subcommand is not None:
-            self.subcommand = subcommand
+            fields['subcommand'] = subcommand
         if time is not None:
-            self.time = time
+            fields['time'] = time
         if user is not None:
-            self.user = user
+            fields['user'] = user
         if origin is not None:
-            self.origin = origin
+            fields['origin'] = origin
         if user_interface is not None:
-            self.user_interface = user_interface
-
-    def __setattr__(self, key, value):
-        if key not in self.attribute_map:
-            raise KeyError("Invalid key `{}` for `Audit`".format(key))
-        self.__dict__[key] = value
-
-    def __getattribute__(self, item):
-        value = object.__getattribute__(self, item)
-        if isinstance(value, Property):
-            raise AttributeError
-        else:
-            return value
-
-    def __getitem__(self, key):
-        if key not in self.attribute_map:
-            raise KeyError("Invalid key `{}` for `Audit`".format(key))
-        return object.__getattribute__(self, key)
-
-    def __setitem__(self, key, value):
-        if key not in self.attribute_map:
-            raise KeyError("Invalid key `{}` for `Audit`".format(key))
-        object.__setattr__(self, key, value)
-
-    def __delitem__(self, key):
-        if key not in self.attribute_map:
-            raise KeyError("Invalid key `{}` for `Audit`".format(key))
-        object.__delattr__(self, key)
-
-    def keys(self):
-        return self.attribute_map.keys()
-
-    def to_dict(self):
-        """Returns the model properties as a dict"""
-        result = {}
-
-        for attr, _ in six.iteritems(self.swagger_types):
-            if hasattr(self, attr):
-                value = getattr(self, attr)
-                if isinstance(value, list):
-                    result[attr] = list(map(
-                        lambda x: x.to_dict() if hasattr(x, "to_dict") else x,
-                        value
-                    ))
-                elif hasattr(value, "to_dict"):
-                    result[attr] = value.to_dict()
-                elif isinstance(value, dict):
-                    result[attr] = dict(map(
-                        lambda item: (item[0], item[1].to_dict())
-                        if hasattr(item[1], "to_dict") else item,
-                        value.items()
-                    ))
-                else:
-                    result[attr] = value
-        if issubclass(Audit, dict):
-            for key, value in self.items():
-                result[key] = value
-
-        return result
-
-    def to_str(self):
-        """Returns the string representation of the model"""
-        return pprint.pformat(self.to_dict())
-
-    def __repr__(self):
-        """For `print` and `pprint`"""
-        return self.to_str()
-
-    def __eq__(self, other):
-        """Returns true if both objects are equal"""
-        if not isinstance(other, Audit):
-            return False
-
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other):
-        """Returns true if both objects are not equal"""
-        return not self == other
+            fields['user_interface'] = user_interface
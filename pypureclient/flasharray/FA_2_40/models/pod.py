@@ -11,17 +11,32 @@
 """
 
 
-import pprint
-import re
-
-import six
+import functools
+from types import MappingProxyType
 import typing
 
-from ....properties import Property
+from .... import _model_base
 if typing.TYPE_CHECKING:
     from pypureclient.flasharray.FA_2_40 import models
 
-class Pod(object):
+
+# Inclusive (minimum, maximum) bounds of the constrained attributes;
+# None means the attribute has no bound on that side
+_RANGES = {
+    'footprint': (0, None),
+    'quota_limit': (None, 4503599627370496),
+}
+
+
+def _validate_range(key, value):
+    minimum, maximum = _RANGES[key]
+    if maximum is not None and value > maximum:
+        raise ValueError("Invalid value for `{}`, value must be less than or equal to `{}`".format(key, maximum))
+    if minimum is not None and value < minimum:
+        raise ValueError("Invalid value for `{}`, must be a value greater than or equal to `{}`".format(key, minimum))
+
+
+class Pod(_model_base.SwaggerModel):
     """
     Attributes:
       swagger_types (dict): The key is attribute name
@@ -29,7 +44,7 @@ class Pod(object):
       attribute_map (dict): The key is attribute name
                             and the value is json key in definition.
     """
-    swagger_types = {
+    swagger_types = _model_base.canonical({
         'id': 'str',
         'name': 'str',
         'context': 'FixedReference',
@@ -50,9 +65,9 @@ class Pod(object):
         'quota_limit': 'int',
         'space': 'PodSpace',
         'members': 'list[ReferenceWithType]'
-    }
+    })
 
-    attribute_map = {
+    attribute_map = _model_base.canonical({
         'id': 'id',
         'name': 'name',
         'context': 'context',
@@ -73,10 +88,17 @@ class Pod(object):
         'quota_limit': 'quota_limit',
         'space': 'space',
         'members': 'members'
-    }
+    })
+
+    _ATTRS = tuple(attribute_map)
+    _ATTR_SET = frozenset(attribute_map)
+
+    _VALIDATORS = MappingProxyType(dict(
+        (key, functools.partial(_validate_range, key)) for key in _RANGES
+    ))
 
-    required_args = {
-    }
+    required_args = _model_base.canonical({
+    })
 
     def __init__(
         self,
@@ -124,126 +146,48 @@ class Pod(object):
             space (PodSpace): Displays provisioned size and physical storage consumption information for the sum of all volumes connected to the specified host.
             members (list[ReferenceWithType]): A list of arrays or realms over which the pod is stretched. If there are two or more members in the stretched pod, all data in the pod is synchronously replicated between all of the members within the pod.
         """
+        if footprint is not None:
+            _validate_range('footprint', footprint)
+        if quota_limit is not None:
+            _validate_range('quota_limit', quota_limit)
+        fields = self.__dict__
         if id is not None:
-            self.id = id
+            fields['id'] = id
         if name is not None:
-            self.name = name
+            fields['name'] = name
         if context is not None:
-            self.context = context
+            fields['context'] = context
         if arrays is not None:
-            self.arrays = arrays
+            fields['arrays'] = arrays
         if destroyed is not None:
-            self.destroyed = destroyed
+            fields['destroyed'] = destroyed
         if failover_preferences is not None:
-            self.failover_preferences = failover_preferences
+            fields['failover_preferences'] = failover_preferences
         if footprint is not None:
-            self.footprint = footprint
+            fields['footprint'] = footprint
         if mediator is not None:
-            self.mediator = mediator
+            fields['mediator'] = mediator
         if mediator_version is not None:
-            self.mediator_version = mediator_version
+            fields['mediator_version'] = mediator_version
         if source is not None:
-            self.source = source
+            fields['source'] = source
         if time_remaining is not None:
-            self.time_remaining = time_remaining
+            fields['time_remaining'] = time_remaining
         if requested_promotion_state is not None:
-            self.requested_promotion_state = requested_promotion_state
+            fields['requested_promotion_state'] = requested_promotion_state
         if promotion_status is not None:
-            self.promotion_status = promotion_status
+            fields['promotion_status'] = promotion_status
         if link_source_count is not None:
-            self.link_source_count = link_source_count
+            fields['link_source_count'] = link_source_count
         if link_target_count is not None:
-            self.link_target_count = link_target_count
+            fields['link_target_count'] = link_target_count
         if array_count is not None:
-            self.array_count = array_count
+            fields['array_count'] = array_count
         if eradication_config is not None:
-            self.eradication_config = eradication_config
+            fields['eradication_config'] = eradication_config
         if quota_limit is not None:
-            self.quota_limit = quota_limit
+            fields['quota_limit'] = quota_limit
         if space is not None:
-            self.space = space
+            fields['space'] = space
         if members is not None:
-            self.members = members
-
-    def __setattr__(self, key, value):
-        if key not in self.attribute_map:
-            raise KeyError("Invalid key `{}` for `Pod`".format(key))
-        if key == "footprint" and value is not None:
-            if value < 0:
-                raise ValueError("Invalid value for `footprint`, must be a value greater than or equal to `0`")
-        if key == "quota_limit" and value is not None:
-            if value > 4503599627370496:
-                raise ValueError("Invalid value for `quota_limit`, value must be less than or equal to `4503599627370496`")
-        self.__dict__[key] = value
-
-    def __getattribute__(self, item):
-        value = object.__getattribute__(self, item)
-        if isinstance(value, Property):
-            raise AttributeError
-        else:
-            return value
-
-    def __getitem__(self, key):
-        if key not in self.attribute_map:
-            raise KeyError("Invalid key `{}` for `Pod`".format(key))
-        return object.__getattribute__(self, key)
-
-    def __setitem__(self, key, value):
-        if key not in self.attribute_map:
-            raise KeyError("Invalid key `{}` for `Pod`".format(key))
-        object.__setattr__(self, key, value)
-
-    def __delitem__(self, key):
-        if key not in self.attribute_map:
-            raise KeyError("Invalid key `{}` for `Pod`".format(key))
-        object.__delattr__(self, key)
-
-    def keys(self):
-        return self.attribute_map.keys()
-
-    def to_dict(self):
-        """Returns the model properties as a dict"""
-        result = {}
-
-        for attr, _ in six.iteritems(self.swagger_types):
-            if hasattr(self, attr):
-                value = getattr(self, attr)
-                if isinstance(value, list):
-                    result[attr] = list(map(
-                        lambda x: x.to_dict() if hasattr(x, "to_dict") else x,
-                        value
-                    ))
-                elif hasattr(value, "to_dict"):
-                    result[attr] = value.to_dict()
-                elif isinstance(value, dict):
-                    result[attr] = dict(map(
-                        lambda item: (item[0], item[1].to_dict())
-                        if hasattr(item[1], "to_dict") else item,
-                        value.items()
-                    ))
-                else:
-                    result[attr] = value
-        if issubclass(Pod, dict):
-            for key, value in self.items():
-                result[key] = value
-
-        return result
-
-    def to_str(self):
-        """Returns the string representation of the model"""
-        return pprint.pformat(self.to_dict())
-
-    def __repr__(self):
-        """For `print` and `pprint`"""
-        return self.to_str()
-
-    def __eq__(self, other):
-        """Returns true if both objects are equal"""
-        if not isinstance(other, Pod):
-            return False
-
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other):
-        """Returns true if both objects are not equal"""
-        return not self == other
+            fields['members'] = members
@@ -11,17 +11,38 @@
 """
 
 
-import pprint
-import re
-
-import six
+import functools
+from types import MappingProxyType
 import typing
 
-from ....properties import Property
+from .... import _model_base
 if typing.TYPE_CHECKING:
     from pypureclient.flasharray.FA_2_40 import models
 
-class PolicyPassword(object):
+
+# Inclusive (minimum, maximum) bounds of the constrained attributes;
+# None means the attribute has no bound on that side
+_RANGES = {
+    'lockout_duration': (1000, 7776000000),
+    'max_login_attempts': (1, 100),
+    'min_password_length': (1, 100),
+    'password_history': (0, 64),
+    'min_password_age': (0, 604800000),
+    'min_character_groups': (0, 4),
+    'min_characters_per_group': (1, None),
+    'max_password_age': (0, 8639913600000),
+}
+
+
+def _validate_range(key, value):
+    minimum, maximum = _RANGES[key]
+    if maximum is not None and value > maximum:
+        raise ValueError("Invalid value for `{}`, value must be less than or equal to `{}`".format(key, maximum))
+    if minimum is not None and value < minimum:
+        raise ValueError("Invalid value for `{}`, must be a value greater than or equal to `{}`".format(key, minimum))
+
+
+class PolicyPassword(_model_base.SwaggerModel):
     """
     Attributes:
       swagger_types (dict): The key is attribute name
@@ -29,7 +50,7 @@ class PolicyPassword(object):
       attribute_map (dict): The key is attribute name
                             and the value is json key in definition.
     """
-    swagger_types = {
+    swagger_types = _model_base.canonical({
         'id': 'str',
         'name': 'str',
         'context': 'FixedReference',
@@ -45,9 +66,9 @@ class PolicyPassword(object):
         'enforce_username_check': 'bool',
         'enforce_dictionary_check': 'bool',
         'max_password_age': 'int'
-    }
+    })
 
-    attribute_map = {
+    attribute_map = _model_base.canonical({
         'id': 'id',
         'name': 'name',
         'context': 'context',
@@ -63,10 +84,17 @@ class PolicyPassword(object):
         'enforce_username_check': 'enforce_username_check',
         'enforce_dictionary_check': 'enforce_dictionary_check',
         'max_password_age': 'max_password_age'
-    }
+    })
+
+    _ATTRS = tuple(attribute_map)
+    _ATTR_SET = frozenset(attribute_map)
+
+    _VALIDATORS = MappingProxyType(dict(
+        (key, functools.partial(_validate_range, key)) for key in _RANGES
+    ))
 
-    required_args = {
-    }
+    required_args = _model_base.canonical({
+    })
 
     def __init__(
         self,
@@ -104,148 +132,42 @@ class PolicyPassword(object):
             enforce_dictionary_check (bool): If `true`, test password against dictionary of known leaked passwords. Only applies to passwords longer than 6 characters.
             max_password_age (int): The maximum age of password before password change is required. Ranges from 1 day to 99999 days, with 0 meaning password expiration is disabled.
         """
+        fields = self.__dict__
         if id is not None:
-            self.id = id
+            fields['id'] = id
         if name is not None:
-            self.name = name
+            fields['name'] = name
         if context is not None:
-            self.context = context
+            fields['context'] = context
         if policy_type is not None:
-            self.policy_type = policy_type
+            fields['policy_type'] = policy_type
         if enabled is not None:
-            self.enabled = enabled
+            fields['enabled'] = enabled
         if lockout_duration is not None:
-            self.lockout_duration = lockout_duration
+            _validate_range('lockout_duration', lockout_duration)
+            fields['lockout_duration'] = lockout_duration
         if max_login_attempts is not None:
-            self.max_login_attempts = max_login_attempts
+            _validate_range('max_login_attempts', max_login_attempts)
+            fields['max_login_attempts'] = max_login_attempts
         if min_password_length is not None:
-            self.min_password_length = min_password_length
+            _validate_range('min_password_length', min_password_length)
+            fields['min_password_length'] = min_password_length
         if password_history is not None:
-            self.password_history = password_history
+            _validate_range('password_history', password_history)
+            fields['password_history'] = password_history
         if min_password_age is not None:
-            self.min_password_age = min_password_age
+            _validate_range('min_password_age', min_password_age)
+            fields['min_password_age'] = min_password_age
         if min_character_groups is not None:
-            self.min_character_groups = min_character_groups
+            _validate_range('min_character_groups', min_character_groups)
+            fields['min_character_groups'] = min_character_groups
         if min_characters_per_group is not None:
-            self.min_characters_per_group = min_characters_per_group
+            _validate_range('min_characters_per_group', min_characters_per_group)
+            fields['min_characters_per_group'] = min_characters_per_group
         if enforce_username_check is not None:
-            self.enforce_username_check = enforce_username_check
+            fields['enforce_username_check'] = enforce_username_check
         if enforce_dictionary_check is not None:
-            self.enforce_dictionary_check = enforce_dictionary_check
+            fields['enforce_dictionary_check'] = enforce_dictionary_check
         if max_password_age is not None:
-            self.max_password_age = max_password_age
-
-    def __setattr__(self, key, value):
-        if key not in self.attribute_map:
-            raise KeyError("Invalid key `{}` for `PolicyPassword`".format(key))
-        if key == "lockout_duration" and value is not None:
-            if value > 7776000000:
-                raise ValueError("Invalid value for `lockout_duration`, value must be less than or equal to `7776000000`")
-            if value < 1000:
-                raise ValueError("Invalid value for `lockout_duration`, must be a value greater than or equal to `1000`")
-        if key == "max_login_attempts" and value is not None:
-            if value > 100:
-                raise ValueError("Invalid value for `max_login_attempts`, value must be less than or equal to `100`")
-            if value < 1:
-                raise ValueError("Invalid value for `max_login_attempts`, must be a value greater than or equal to `1`")
-        if key == "min_password_length" and value is not None:
-            if value > 100:
-                raise ValueError("Invalid value for `min_password_length`, value must be less than or equal to `100`")
-            if value < 1:
-                raise ValueError("Invalid value for `min_password_length`, must be a value greater than or equal to `1`")
-        if key == "password_history" and value is not None:
-            if value > 64:
-                raise ValueError("Invalid value for `password_history`, value must be less than or equal to `64`")
-            if value < 0:
-                raise ValueError("Invalid value for `password_history`, must be a value greater than or equal to `0`")
-        if key == "min_password_age" and value is not None:
-            if value > 604800000:
-                raise ValueError("Invalid value for `min_password_age`, value must be less than or equal to `604800000`")
-            if value < 0:
-                raise ValueError("Invalid value for `min_password_age`, must be a value greater than or equal to `0`")
-        if key == "min_character_groups" and value is not None:
-            if value > 4:
-                raise ValueError("Invalid value for `min_character_groups`, value must be less than or equal to `4`")
-            if value < 0:
-                raise ValueError("Invalid value for `min_character_groups`, must be a value greater than or equal to `0`")
-        if key == "min_characters_per_group" and value is not None:
-            if value < 1:
-                raise ValueError("Invalid value for `min_characters_per_group`, must be a value greater than or equal to `1`")
-        if key == "max_password_age" and value is not None:
-            if value > 8639913600000:
-                raise ValueError("Invalid value for `max_password_age`, value must be less than or equal to `8639913600000`")
-            if value < 0:
-                raise ValueError("Invalid value for `max_password_age`, must be a value greater than or equal to `0`")
-        self.__dict__[key] = value
-
-    def __getattribute__(self, item):
-        value = object.__getattribute__(self, item)
-        if isinstance(value, Property):
-            raise AttributeError
-        else:
-            return value
-
-    def __getitem__(self, key):
-        if key not in self.attribute_map:
-            raise KeyError("Invalid key `{}` for `PolicyPassword`".format(key))
-        return object.__getattribute__(self, key)
-
-    def __setitem__(self, key, value):
-        if key not in self.attribute_map:
-            raise KeyError("Invalid key `{}` for `PolicyPassword`".format(key))
-        object.__setattr__(self, key, value)
-
-    def __delitem__(self, key):
-        if key not in self.attribute_map:
-            raise KeyError("Invalid key `{}` for `PolicyPassword`".format(key))
-        object.__delattr__(self, key)
-
-    def keys(self):
-        return self.attribute_map.keys()
-
-    def to_dict(self):
-        """Returns the model properties as a dict"""
-        result = {}
-
-        for attr, _ in six.iteritems(self.swagger_types):
-            if hasattr(self, attr):
-                value = getattr(self, attr)
-                if isinstance(value, list):
-                    result[attr] = list(map(
-                        lambda x: x.to_dict() if hasattr(x, "to_dict") else x,
-                        value
-                    ))
-                elif hasattr(value, "to_dict"):
-                    result[attr] = value.to_dict()
-                elif isinstance(value, dict):
-                    result[attr] = dict(map(
-                        lambda item: (item[0], item[1].to_dict())
-                        if hasattr(item[1], "to_dict") else item,
-                        value.items()
-                    ))
-                else:
-                    result[attr] = value
-        if issubclass(PolicyPassword, dict):
-            for key, value in self.items():
-                result[key] = value
-
-        return result
-
-    def to_str(self):
-        """Returns the string representation of the model"""
-        return pprint.pformat(self.to_dict())
-
-    def __repr__(self):
-        """For `print` and `pprint`"""
-        return self.to_str()
-
-    def __eq__(self, other):
-        """Returns true if both objects are equal"""
-        if not isinstance(other, PolicyPassword):
-            return False
-
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other):
-        """Returns true if both objects are not equal"""
-        return not self == other
+            _validate_range('max_password_age', max_password_age)
+            fields['max_password_age'] = max_password_age
@@ -11,17 +11,13 @@
 """
 
 
-import pprint
-import re
-
-import six
 import typing
 
-from ....properties import Property
+from .... import _model_base
 if typing.TYPE_CHECKING:
     from pypureclient.flasharray.FA_2_40 import models
 
-class RemoteVolumeSnapshot(object):
+class RemoteVolumeSnapshot(_model_base.SwaggerModel):
     """
     Attributes:
       swagger_types (dict): The key is attribute name
@@ -29,7 +25,7 @@ class RemoteVolumeSnapshot(object):
       attribute_map (dict): The key is attribute name
                             and the value is json key in definition.
     """
-    swagger_types = {
+    swagger_types = _model_base.canonical({
         'id': 'str',
         'name': 'str',
         'created': 'int',
@@ -41,9 +37,9 @@ class RemoteVolumeSnapshot(object):
         'time_remaining': 'int',
         'context': 'FixedReference',
         'remote': 'FixedReference'
-    }
+    })
 
-    attribute_map = {
+    attribute_map = _model_base.canonical({
         'id': 'id',
         'name': 'name',
         'created': 'created',
@@ -55,10 +51,13 @@ class RemoteVolumeSnapshot(object):
         'time_remaining': 'time_remaining',
         'context': 'context',
         'remote': 'remote'
-    }
+    })
+
+    _ATTRS = tuple(attribute_map)
+    _ATTR_SET = frozenset(attribute_map)
 
-    required_args = {
-    }
+    required_args = _model_base.canonical({
+    })
 
     def __init__(
         self,
@@ -88,102 +87,26 @@ class RemoteVolumeSnapshot(object):
             context (FixedReference): The context in which the operation was performed. Valid values include a reference to any array which is a member of the same fleet. If the array is not a member of a fleet, `context` will always implicitly be set to the array that received the request. Other parameters provided with the request, such as names of volumes or snapshots, are resolved relative to the provided `context`.
             remote (FixedReference): Remote target where this volume snapshot is located.
         """
+        fields = self.__dict__
         if id is not None:
-            self.id = id
+            fields['id'] = id
         if name is not None:
-            self.name = name
+            fields['name'] = name
         if created is not None:
-            self.created = created
+            fields['created'] = created
         if destroyed is not None:
-            self.destroyed = destroyed
+            fields['destroyed'] = destroyed
         if pod is not None:
-            self.pod = pod
+            fields['pod'] = pod
         if provisioned is not None:
-            self.provisioned = provisioned
+            fields['provisioned'] = provisioned
         if source is not None:
-            self.source = source
+            fields['source'] = source
         if suffix is not None:
-            self.suffix = suffix
+            fields['suffix'] = suffix
         if time_remaining is not None:
-            self.time_remaining = time_remaining
+            fields['time_remaining'] = time_remaining
         if context is not None:
-            self.context = context
+            fields['context'] = context
         if remote is not None:
-            self.remote = remote
-
-    def __setattr__(self, key, value):
-        if key not in self.attribute_map:
-            raise KeyError("Invalid key `{}` for `RemoteVolumeSnapshot`".format(key))
-        self.__dict__[key] = value
-
-    def __getattribute__(self, item):
-        value = object.__getattribute__(self, item)
-        if isinstance(value, Property):
-            raise AttributeError
-        else:
-            return value
-
-    def __getitem__(self, key):
-        if key not in self.attribute_map:
-            raise KeyError("Invalid key `{}` for `RemoteVolumeSnapshot`".format(key))
-        return object.__getattribute__(self, key)
-
-    def __setitem__(self, key, value):
-        if key not in self.attribute_map:
-            raise KeyError("Invalid key `{}` for `RemoteVolumeSnapshot`".format(key))
-        object.__setattr__(self, key, value)
-
-    def __delitem__(self, key):
-        if key not in self.attribute_map:
-            raise KeyError("Invalid key `{}` for `RemoteVolumeSnapshot`".format(key))
-        object.__delattr__(self, key)
-
-    def keys(self):
-        return self.attribute_map.keys()
-
-    def to_dict(self):
-        """Returns the model properties as a dict"""
-        result = {}
-
-        for attr, _ in six.iteritems(self.swagger_types):
-            if hasattr(self, attr):
-                value = getattr(self, attr)
-                if isinstance(value, list):
-                    result[attr] = list(map(
-                        lambda x: x.to_dict() if hasattr(x, "to_dict") else x,
-                        value
-                    ))
-                elif hasattr(value, "to_dict"):
-                    result[attr] = value.to_dict()
-                elif isinstance(value, dict):
-                    result[attr] = dict(map(
-                        lambda item: (item[0], item[1].to_dict())
-                        if hasattr(item[1], "to_dict") else item,
-                        value.items()
-                    ))
-                else:
-                    result[attr] = value
-        if issubclass(RemoteVolumeSnapshot, dict):
-            for key, value in self.items():
-                result[key] = value
-
-        return result
-
-    def to_str(self):
-        """Returns the string representation of the model"""
-        return pprint.pformat(self.to_dict())
-
-    def __repr__(self):
-        """For `print` and `pprint`"""
-        return self.to_str()
-
-    def __eq__(self, other):
-        """Returns true if both objects are equal"""
-        if not isinstance(other, RemoteVolumeSnapshot):
-            return False
-
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other):
-        """Returns true if both objects are not equal"""
-        return not self == other
+            fields['remote'] = remote
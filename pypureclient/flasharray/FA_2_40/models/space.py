@@ -11,17 +11,46 @@
 """
 
 
-import pprint
-import re
-
-import six
+import functools
+from types import MappingProxyType
 import typing
 
-from ....properties import Property
+from .... import _model_base
 if typing.TYPE_CHECKING:
     from pypureclient.flasharray.FA_2_40 import models
 
-class Space(object):
+
+# Inclusive (minimum, maximum) bounds of the constrained attributes;
+# None means the attribute has no bound on that side
+_RANGES = {
+    'shared': (0, None),
+    'snapshots': (0, None),
+    'system': (0, None),
+    'thin_provisioning': (0.0, 1.0),
+    'total_physical': (0, None),
+    'total_provisioned': (0, None),
+    'unique': (0, None),
+    'virtual': (0, None),
+    'used_provisioned': (0, None),
+    'total_used': (0, None),
+    'footprint': (0, None),
+    'shared_effective': (0, None),
+    'snapshots_effective': (0, None),
+    'unique_effective': (0, None),
+    'total_effective': (0, None),
+    'replication': (0, None),
+}
+
+
+def _validate_range(key, value):
+    minimum, maximum = _RANGES[key]
+    if maximum is not None and value > maximum:
+        raise ValueError("Invalid value for `{}`, value must be less than or equal to `{}`".format(key, maximum))
+    if minimum is not None and value < minimum:
+        raise ValueError("Invalid value for `{}`, must be a value greater than or equal to `{}`".format(key, minimum))
+
+
+class Space(_model_base.SwaggerModel):
     """
     Attributes:
       swagger_types (dict): The key is attribute name
@@ -29,7 +58,7 @@ class Space(object):
       attribute_map (dict): The key is attribute name
                             and the value is json key in definition.
     """
-    swagger_types = {
+    swagger_types = _model_base.canonical({
         'data_reduction': 'float',
         'shared': 'int',
         'snapshots': 'int',
@@ -48,9 +77,9 @@ class Space(object):
         'unique_effective': 'int',
         'total_effective': 'int',
         'replication': 'int'
-    }
+    })
 
-    attribute_map = {
+    attribute_map = _model_base.canonical({
         'data_reduction': 'data_reduction',
         'shared': 'shared',
         'snapshots': 'snapshots',
@@ -69,10 +98,17 @@ class Space(object):
         'unique_effective': 'unique_effective',
         'total_effective': 'total_effective',
         'replication': 'replication'
-    }
+    })
+
+    _ATTRS = tuple(attribute_map)
+    _ATTR_SET = frozenset(attribute_map)
 
-    required_args = {
-    }
+    required_args = _model_base.canonical({
+    })
+
+    _VALIDATORS = MappingProxyType(dict(
+        (key, functools.partial(_validate_range, key)) for key in _RANGES
+    ))
 
     def __init__(
         self,
@@ -116,166 +152,56 @@ class Space(object):
             total_effective (int): This field has been deprecated. It will return `null`. PUse the `total_physical` field instead, as it contains the same information for Evergreen//One arrays.
             replication (int): The sum of replication space consumed by all pods on this array.
         """
+        fields = self.__dict__
         if data_reduction is not None:
-            self.data_reduction = data_reduction
+            fields['data_reduction'] = data_reduction
         if shared is not None:
-            self.shared = shared
+            _validate_range('shared', shared)
+            fields['shared'] = shared
         if snapshots is not None:
-            self.snapshots = snapshots
+            _validate_range('snapshots', snapshots)
+            fields['snapshots'] = snapshots
         if system is not None:
-            self.system = system
+            _validate_range('system', system)
+            fields['system'] = system
         if thin_provisioning is not None:
-            self.thin_provisioning = thin_provisioning
+            _validate_range('thin_provisioning', thin_provisioning)
+            fields['thin_provisioning'] = thin_provisioning
         if total_physical is not None:
-            self.total_physical = total_physical
+            _validate_range('total_physical', total_physical)
+            fields['total_physical'] = total_physical
         if total_provisioned is not None:
-            self.total_provisioned = total_provisioned
+            _validate_range('total_provisioned', total_provisioned)
+            fields['total_provisioned'] = total_provisioned
         if total_reduction is not None:
-            self.total_reduction = total_reduction
+            fields['total_reduction'] = total_reduction
         if unique is not None:
-            self.unique = unique
+            _validate_range('unique', unique)
+            fields['unique'] = unique
         if virtual is not None:
-            self.virtual = virtual
+            _validate_range('virtual', virtual)
+            fields['virtual'] = virtual
         if used_provisioned is not None:
-            self.used_provisioned = used_provisioned
+            _validate_range('used_provisioned', used_provisioned)
+            fields['used_provisioned'] = used_provisioned
         if total_used is not None:
-            self.total_used = total_used
+            _validate_range('total_used', total_used)
+            fields['total_used'] = total_used
         if footprint is not None:
-            self.footprint = footprint
+            _validate_range('footprint', footprint)
+            fields['footprint'] = footprint
         if shared_effective is not None:
-            self.shared_effective = shared_effective
+            _validate_range('shared_effective', shared_effective)
+            fields['shared_effective'] = shared_effective
         if snapshots_effective is not None:
-            self.snapshots_effective = snapshots_effective
+            _validate_range('snapshots_effective', snapshots_effective)
+            fields['snapshots_effective'] = snapshots_effective
         if unique_effective is not None:
-            self.unique_effective = unique_effective
+            _validate_range('unique_effective', unique_effective)
+            fields['unique_effective'] = unique_effective
         if total_effective is not None:
-            self.total_effective = total_effective
+            _validate_range('total_effective', total_effective)
+            fields['total_effective'] = total_effective
         if replication is not None:
-            self.replication = replication
-
-    def __setattr__(self, key, value):
-        if key not in self.attribute_map:
-            raise KeyError("Invalid key `{}` for `Space`".format(key))
-        if key == "shared" and value is not None:
-            if value < 0:
-                raise ValueError("Invalid value for `shared`, must be a value greater than or equal to `0`")
-        if key == "snapshots" and value is not None:
-            if value < 0:
-                raise ValueError("Invalid value for `snapshots`, must be a value greater than or equal to `0`")
-        if key == "system" and value is not None:
-            if value < 0:
-                raise ValueError("Invalid value for `system`, must be a value greater than or equal to `0`")
-        if key == "thin_provisioning" and value is not None:
-            if value > 1.0:
-                raise ValueError("Invalid value for `thin_provisioning`, value must be less than or equal to `1.0`")
-            if value < 0.0:
-                raise ValueError("Invalid value for `thin_provisioning`, must be a value greater than or equal to `0.0`")
-        if key == "total_physical" and value is not None:
-            if value < 0:
-                raise ValueError("Invalid value for `total_physical`, must be a value greater than or equal to `0`")
-        if key == "total_provisioned" and value is not None:
-            if value < 0:
-                raise ValueError("Invalid value for `total_provisioned`, must be a value greater than or equal to `0`")
-        if key == "unique" and value is not None:
-            if value < 0:
-                raise ValueError("Invalid value for `unique`, must be a value greater than or equal to `0`")
-        if key == "virtual" and value is not None:
-            if value < 0:
-                raise ValueError("Invalid value for `virtual`, must be a value greater than or equal to `0`")
-        if key == "used_provisioned" and value is not None:
-            if value < 0:
-                raise ValueError("Invalid value for `used_provisioned`, must be a value greater than or equal to `0`")
-        if key == "total_used" and value is not None:
-            if value < 0:
-                raise ValueError("Invalid value for `total_used`, must be a value greater than or equal to `0`")
-        if key == "footprint" and value is not None:
-            if value < 0:
-                raise ValueError("Invalid value for `footprint`, must be a value greater than or equal to `0`")
-        if key == "shared_effective" and value is not None:
-            if value < 0:
-                raise ValueError("Invalid value for `shared_effective`, must be a value greater than or equal to `0`")
-        if key == "snapshots_effective" and value is not None:
-            if value < 0:
-                raise ValueError("Invalid value for `snapshots_effective`, must be a value greater than or equal to `0`")
-        if key == "unique_effective" and value is not None:
-            if value < 0:
-                raise ValueError("Invalid value for `unique_effective`, must be a value greater than or equal to `0`")
-        if key == "total_effective" and value is not None:
-            if value < 0:
-                raise ValueError("Invalid value for `total_effective`, must be a value greater than or equal to `0`")
-        if key == "replication" and value is not None:
-            if value < 0:
-                raise ValueError("Invalid value for `replication`, must be a value greater than or equal to `0`")
-        self.__dict__[key] = value
-
-    def __getattribute__(self, item):
-        value = object.__getattribute__(self, item)
-        if isinstance(value, Property):
-            raise AttributeError
-        else:
-            return value
-
-    def __getitem__(self, key):
-        if key not in self.attribute_map:
-            raise KeyError("Invalid key `{}` for `Space`".format(key))
-        return object.__getattribute__(self, key)
-
-    def __setitem__(self, key, value):
-        if key not in self.attribute_map:
-            raise KeyError("Invalid key `{}` for `Space`".format(key))
-        object.__setattr__(self, key, value)
-
-    def __delitem__(self, key):
-        if key not in self.attribute_map:
-            raise KeyError("Invalid key `{}` for `Space`".format(key))
-        object.__delattr__(self, key)
-
-    def keys(self):
-        return self.attribute_map.keys()
-
-    def to_dict(self):
-        """Returns the model properties as a dict"""
-        result = {}
-
-        for attr, _ in six.iteritems(self.swagger_types):
-            if hasattr(self, attr):
-                value = getattr(self, attr)
-                if isinstance(value, list):
-                    result[attr] = list(map(
-                        lambda x: x.to_dict() if hasattr(x, "to_dict") else x,
-                        value
-                    ))
-                elif hasattr(value, "to_dict"):
-                    result[attr] = value.to_dict()
-                elif isinstance(value, dict):
-                    result[attr] = dict(map(
-                        lambda item: (item[0], item[1].to_dict())
-                        if hasattr(item[1], "to_dict") else item,
-                        value.items()
-                    ))
-                else:
-                    result[attr] = value
-        if issubclass(Space, dict):
-            for key, value in self.items():
-                result[key] = value
-
-        return result
-
-    def to_str(self):
-        """Returns the string representation of the model"""
-        return pprint.pformat(self.to_dict())
-
-    def __repr__(self):
-        """For `print` and `pprint`"""
-        return self.to_str()
-
-    def __eq__(self, other):
-        """Returns true if both objects are equal"""
-        if not isinstance(other, Space):
-            return False
-
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other):
-        """Returns true if both objects are not equal"""
-        return not self == other
+            _validate_range('replication', replication)
+            fields['replication'] = replication
@@ -11,17 +11,13 @@
 """
 
 
-import pprint
-import re
-
-import six
 import typing
 
-from ....properties import Property
+from .... import _model_base
 if typing.TYPE_CHECKING:
     from pypureclient.flasharray.FA_2_40 import models
 
-class TestResultWithResourceWithId(object):
+class TestResultWithResourceWithId(_model_base.SwaggerModel):
     """
     Attributes:
       swagger_types (dict): The key is attribute name
@@ -29,7 +25,7 @@ class TestResultWithResourceWithId(object):
       attribute_map (dict): The key is attribute name
                             and the value is json key in definition.
     """
-    swagger_types = {
+    swagger_types = _model_base.canonical({
         'component_address': 'str',
         'component_name': 'str',
         'description': 'str',
@@ -40,9 +36,9 @@ class TestResultWithResourceWithId(object):
         'test_type': 'str',
         'context': 'FixedReference',
         'resource': 'FixedReference'
-    }
+    })
 
-    attribute_map = {
+    attribute_map = _model_base.canonical({
         'component_address': 'component_address',
         'component_name': 'component_name',
         'description': 'description',
@@ -53,10 +49,13 @@ class TestResultWithResourceWithId(object):
         'test_type': 'test_type',
         'context': 'context',
         'resource': 'resource'
-    }
+    })
+
+    _ATTRS = tuple(attribute_map)
+    _ATTR_SET = frozenset(attribute_map)
 
-    required_args = {
-    }
+    required_args = _model_base.canonical({
+    })
 
     def __init__(
         self,
@@ -84,100 +83,24 @@ class TestResultWithResourceWithId(object):
             context (FixedReference): The context in which the operation was performed. Valid values include a reference to any array which is a member of the same fleet. If the array is not a member of a fleet, `context` will always implicitly be set to the array that received the request. Other parameters provided with the request, such as names of volumes or snapshots, are resolved relative to the provided `context`.
             resource (FixedReference): A reference to the object being tested.
         """
+        fields = self.__dict__
         if component_address is not None:
-            self.component_address = component_address
+            fields['component_address'] = component_address
         if component_name is not None:
-            self.component_name = component_name
+            fields['component_name'] = component_name
         if description is not None:
-            self.description = description
+            fields['description'] = description
         if destination is not None:
-            self.destination = destination
+            fields['destination'] = destination
         if enabled is not None:
-            self.enabled = enabled
+            fields['enabled'] = enabled
         if result_details is not None:
-            self.result_details = result_details
+            fields['result_details'] = result_details
         if success is not None:
-            self.success = success
+            fields['success'] = success
         if test_type is not None:
-            self.test_type = test_type
+            fields['test_type'] = test_type
         if context is not None:
-            self.context = context
+            fields['context'] = context
         if resource is not None:
-            self.resource = resource
-
-    def __setattr__(self, key, value):
-        if key not in self.attribute_map:
-            raise KeyError("Invalid key `{}` for `TestResultWithResourceWithId`".format(key))
-        self.__dict__[key] = value
-
-    def __getattribute__(self, item):
-        value = object.__getattribute__(self, item)
-        if isinstance(value, Property):
-            raise AttributeError
-        else:
-            return value
-
-    def __getitem__(self, key):
-        if key not in self.attribute_map:
-            raise KeyError("Invalid key `{}` for `TestResultWithResourceWithId`".format(key))
-        return object.__getattribute__(self, key)
-
-    def __setitem__(self, key, value):
-        if key not in self.attribute_map:
-            raise KeyError("Invalid key `{}` for `TestResultWithResourceWithId`".format(key))
-        object.__setattr__(self, key, value)
-
-    def __delitem__(self, key):
-        if key not in self.attribute_map:
-            raise KeyError("Invalid key `{}` for `TestResultWithResourceWithId`".format(key))
-        object.__delattr__(self, key)
-
-    def keys(self):
-        return self.attribute_map.keys()
-
-    def to_dict(self):
-        """Returns the model properties as a dict"""
-        result = {}
-
-        for attr, _ in six.iteritems(self.swagger_types):
-            if hasattr(self, attr):
-                value = getattr(self, attr)
-                if isinstance(value, list):
-                    result[attr] = list(map(
-                        lambda x: x.to_dict() if hasattr(x, "to_dict") else x,
-                        value
-                    ))
-                elif hasattr(value, "to_dict"):
-                    result[attr] = value.to_dict()
-                elif isinstance(value, dict):
-                    result[attr] = dict(map(
-                        lambda item: (item[0], item[1].to_dict())
-                        if hasattr(item[1], "to_dict") else item,
-                        value.items()
-                    ))
-                else:
-                    result[attr] = value
-        if issubclass(TestResultWithResourceWithId, dict):
-            for key, value in self.items():
-                result[key] = value
-
-        return result
-
-    def to_str(self):
-        """Returns the string representation of the model"""
-        return pprint.pformat(self.to_dict())
-
-    def __repr__(self):
-        """For `print` and `pprint`"""
-        return self.to_str()
-
-    def __eq__(self, other):
-        """Returns true if both objects are equal"""
-        if not isinstance(other, TestResultWithResourceWithId):
-            return False
-
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other):
-        """Returns true if both objects are not equal"""
-        return not self == other
+            fields['resource'] = resource
@@ -11,21 +11,49 @@
 """
 
 
-from __future__ import absolute_import
+import os
+import pathlib
+import typing
+from collections import OrderedDict
+from types import MappingProxyType
 
-import re
+from .. import models
+if typing.TYPE_CHECKING:
+    from typing import List, Optional
 
-# python 2 and python 3 compatibility library
-import six
-import uuid
-from typing import List, Optional
+# Request arguments that are the same on every call. The ApiClient only reads
+# them, so each method passes these shared read-only instances; query and
+# header params stay per-call since authentication may add to them.
+_AUTH_SETTINGS = ('AuthorizationHeader',)
+_EMPTY_DICT = MappingProxyType({})
+_EMPTY_TUPLE = ()
+
+# Formats of the list query parameters; a key only takes effect when the
+# parameter is actually sent
+_DELETE_COLLECTION_FORMATS = MappingProxyType({'ids': 'csv', 'names': 'csv'})
+_DOWNLOAD_COLLECTION_FORMATS = MappingProxyType({'keytab_ids': 'csv', 'keytab_names': 'csv'})
+_GET_COLLECTION_FORMATS = MappingProxyType({'ids': 'csv', 'names': 'csv', 'sort': 'csv'})
+
+
+def _unique(values):
+    """Drops repeated ids or names, keeping each one at its first position"""
+    return list(OrderedDict.fromkeys(values))
 
-from .. import models
 
 class KeytabsApi(object):
 
     def __init__(self, api_client):
         self.api_client = api_client
+        # The accepted and sent media types are fixed per endpoint, so the
+        # headers are negotiated once instead of on every request
+        self._accept_json = api_client.select_header_accept(
+            ['application/json'])
+        self._accept_keytab_file = api_client.select_header_accept(
+            ['application/octet-stream', 'text/plain'])
+        self._content_type_json = api_client.select_header_content_type(
+            ['application/json'])
+        self._content_type_multipart = api_client.select_header_content_type(
+            ['multipart/form-data'])
 
     def api20_keytabs_delete_with_http_info(
         self,
@@ -56,50 +84,38 @@ class KeytabsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-        if ids is not None:
-            if not isinstance(ids, list):
-                ids = [ids]
-        if names is not None:
-            if not isinstance(names, list):
-                names = [names]
-        params = {k: v for k, v in six.iteritems(locals()) if v is not None}
-
-        # Convert the filter into a string
-        if params.get('filter'):
-            params['filter'] = str(params['filter'])
-        if params.get('sort'):
-            params['sort'] = [str(_x) for _x in params['sort']]
-        # Assign a value to X-Request-Id if it is not specified
-        if params.get('x_request_id') is None:
-            params['x_request_id'] = str(uuid.uuid4())
-
-        collection_formats = {}
-        path_params = {}
+        if ids is not None and not isinstance(ids, list):
+            ids = [ids]
+        if names is not None and not isinstance(names, list):
+            names = [names]
+        if ids is not None and len(ids) > 1:
+            ids = _unique(ids)
+        if names is not None and len(names) > 1:
+            names = _unique(names)
+
+        collection_formats = _DELETE_COLLECTION_FORMATS
+        path_params = _EMPTY_DICT
 
         query_params = []
-        if 'ids' in params:
-            query_params.append(('ids', params['ids']))
-            collection_formats['ids'] = 'csv'
-        if 'names' in params:
-            query_params.append(('names', params['names']))
-            collection_formats['names'] = 'csv'
+        if ids is not None:
+            query_params.append(('ids', ids))
+        if names is not None:
+            query_params.append(('names', names))
 
         header_params = {}
 
-        form_params = []
-        local_var_files = {}
+        form_params = _EMPTY_TUPLE
+        local_var_files = _EMPTY_DICT
 
         body_params = None
         # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])
+        header_params['Accept'] = self._accept_json
 
         # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(
-            ['application/json'])
+        header_params['Content-Type'] = self._content_type_json
 
         # Authentication setting
-        auth_settings = ['AuthorizationHeader']
+        auth_settings = _AUTH_SETTINGS
 
         return self.api_client.call_api(
             '/api/2.0/keytabs', 'DELETE',
@@ -141,56 +157,43 @@ class KeytabsApi(object):
         :param bool async_req: Request runs in separate thread and method returns multiprocessing.pool.ApplyResult.
         :param bool _return_http_data_only: Returns only data field.
         :param bool _preload_content: Response is converted into objects.
+                 If False, the undecoded `urllib3.HTTPResponse` is returned
+                 without buffering the keytab file; read it in chunks with
+                 `response.stream(65536)` and call `release_conn()` when done.
         :param int _request_timeout: Total request timeout in seconds.
                  It can also be a tuple of (connection time, read time) timeouts.
         :return: KeytabFileResponse
                  If the method is called asynchronously,
                  returns the request thread.
         """
-        if keytab_ids is not None:
-            if not isinstance(keytab_ids, list):
-                keytab_ids = [keytab_ids]
-        if keytab_names is not None:
-            if not isinstance(keytab_names, list):
-                keytab_names = [keytab_names]
-        params = {k: v for k, v in six.iteritems(locals()) if v is not None}
+        if keytab_ids is not None and not isinstance(keytab_ids, list):
+            keytab_ids = [keytab_ids]
+        if keytab_names is not None and not isinstance(keytab_names, list):
+            keytab_names = [keytab_names]
 
-        # Convert the filter into a string
-        if params.get('filter'):
-            params['filter'] = str(params['filter'])
-        if params.get('sort'):
-            params['sort'] = [str(_x) for _x in params['sort']]
-        # Assign a value to X-Request-Id if it is not specified
-        if params.get('x_request_id') is None:
-            params['x_request_id'] = str(uuid.uuid4())
-
-        collection_formats = {}
-        path_params = {}
+        collection_formats = _DOWNLOAD_COLLECTION_FORMATS
+        path_params = _EMPTY_DICT
 
         query_params = []
-        if 'keytab_ids' in params:
-            query_params.append(('keytab_ids', params['keytab_ids']))
-            collection_formats['keytab_ids'] = 'csv'
-        if 'keytab_names' in params:
-            query_params.append(('keytab_names', params['keytab_names']))
-            collection_formats['keytab_names'] = 'csv'
+        if keytab_ids is not None:
+            query_params.append(('keytab_ids', keytab_ids))
+        if keytab_names is not None:
+            query_params.append(('keytab_names', keytab_names))
 
         header_params = {}
 
-        form_params = []
-        local_var_files = {}
+        form_params = _EMPTY_TUPLE
+        local_var_files = _EMPTY_DICT
 
         body_params = None
         # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/octet-stream', 'text/plain'])
+        header_params['Accept'] = self._accept_keytab_file
 
         # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(
-            ['application/json'])
+        header_params['Content-Type'] = self._content_type_json
 
         # Authentication setting
-        auth_settings = ['AuthorizationHeader']
+        auth_settings = _AUTH_SETTINGS
 
         return self.api_client.call_api(
             '/api/2.0/keytabs/download', 'GET',
@@ -248,68 +251,57 @@ class KeytabsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-        if ids is not None:
-            if not isinstance(ids, list):
-                ids = [ids]
-        if names is not None:
-            if not isinstance(names, list):
-                names = [names]
-        if sort is not None:
-            if not isinstance(sort, list):
-                sort = [sort]
-        params = {k: v for k, v in six.iteritems(locals()) if v is not None}
-
-        # Convert the filter into a string
-        if params.get('filter'):
-            params['filter'] = str(params['filter'])
-        if params.get('sort'):
-            params['sort'] = [str(_x) for _x in params['sort']]
-        # Assign a value to X-Request-Id if it is not specified
-        if params.get('x_request_id') is None:
-            params['x_request_id'] = str(uuid.uuid4())
-
-        if 'limit' in params and params['limit'] < 0:
+        if limit is not None and limit < 0:
             raise ValueError("Invalid value for parameter `limit` when calling `api20_keytabs_get`, must be a value greater than or equal to `0`")
-        if 'offset' in params and params['offset'] < 0:
+        if offset is not None and offset < 0:
             raise ValueError("Invalid value for parameter `offset` when calling `api20_keytabs_get`, must be a value greater than or equal to `0`")
-        collection_formats = {}
-        path_params = {}
 
-        query_params = []
-        if 'continuation_token' in params:
-            query_params.append(('continuation_token', params['continuation_token']))
-        if 'filter' in params:
-            query_params.append(('filter', params['filter']))
-        if 'ids' in params:
-            query_params.append(('ids', params['ids']))
-            collection_formats['ids'] = 'csv'
-        if 'limit' in params:
-            query_params.append(('limit', params['limit']))
-        if 'names' in params:
-            query_params.append(('names', params['names']))
-            collection_formats['names'] = 'csv'
-        if 'offset' in params:
-            query_params.append(('offset', params['offset']))
-        if 'sort' in params:
-            query_params.append(('sort', params['sort']))
-            collection_formats['sort'] = 'csv'
+        if ids is not None and not isinstance(ids, list):
+            ids = [ids]
+        if names is not None and not isinstance(names, list):
+            names = [names]
+        if ids is not None and len(ids) > 1:
+            ids = _unique(ids)
+        if names is not None and len(names) > 1:
+            names = _unique(names)
+        if sort is not None and not isinstance(sort, list):
+            sort = [sort]
+
+        # Convert the filter into a string
+        if filter:
+            filter = str(filter)
+        if sort:
+            sort = [str(_x) for _x in sort]
+
+        collection_formats = _GET_COLLECTION_FORMATS
+        path_params = _EMPTY_DICT
+
+        query_params = [
+            (key, value) for key, value in (
+                ('continuation_token', continuation_token),
+                ('filter', filter),
+                ('ids', ids),
+                ('limit', limit),
+                ('names', names),
+                ('offset', offset),
+                ('sort', sort),
+            ) if value is not None
+        ]
 
         header_params = {}
 
-        form_params = []
-        local_var_files = {}
+        form_params = _EMPTY_TUPLE
+        local_var_files = _EMPTY_DICT
 
         body_params = None
         # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])
+        header_params['Accept'] = self._accept_json
 
         # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(
-            ['application/json'])
+        header_params['Content-Type'] = self._content_type_json
 
         # Authentication setting
-        auth_settings = ['AuthorizationHeader']
+        auth_settings = _AUTH_SETTINGS
 
         return self.api_client.call_api(
             '/api/2.0/keytabs', 'GET',
@@ -357,45 +349,33 @@ class KeytabsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-        params = {k: v for k, v in six.iteritems(locals()) if v is not None}
-
-        # Convert the filter into a string
-        if params.get('filter'):
-            params['filter'] = str(params['filter'])
-        if params.get('sort'):
-            params['sort'] = [str(_x) for _x in params['sort']]
-        # Assign a value to X-Request-Id if it is not specified
-        if params.get('x_request_id') is None:
-            params['x_request_id'] = str(uuid.uuid4())
         # verify the required parameter 'keytab' is set
         if keytab is None:
             raise TypeError("Missing the required parameter `keytab` when calling `api20_keytabs_post`")
 
-        collection_formats = {}
-        path_params = {}
+        collection_formats = _EMPTY_DICT
+        path_params = _EMPTY_DICT
 
         query_params = []
-        if 'name_prefixes' in params:
-            query_params.append(('name_prefixes', params['name_prefixes']))
+        if name_prefixes is not None:
+            query_params.append(('name_prefixes', name_prefixes))
 
         header_params = {}
 
-        form_params = []
-        local_var_files = {}
+        form_params = _EMPTY_TUPLE
+        local_var_files = _EMPTY_DICT
 
         body_params = None
-        if 'keytab' in params:
-            body_params = params['keytab']
+        if keytab is not None:
+            body_params = keytab
         # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])
+        header_params['Accept'] = self._accept_json
 
         # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(
-            ['application/json'])
+        header_params['Content-Type'] = self._content_type_json
 
         # Authentication setting
-        auth_settings = ['AuthorizationHeader']
+        auth_settings = _AUTH_SETTINGS
 
         return self.api_client.call_api(
             '/api/2.0/keytabs', 'POST',
@@ -433,6 +413,9 @@ class KeytabsApi(object):
         >>> result = thread.get()
 
         :param str keytab_file: The keytab file to upload. (required)
+                 May also be a file object opened in binary mode, or a
+                 pathlib path to the keytab file, which are preferred for
+                 keytabs in the native binary format.
         :param str name_prefixes: The prefix to use for the names of all Kerberos keytab objects that are being created.
         :param bool async_req: Request runs in separate thread and method returns multiprocessing.pool.ApplyResult.
         :param bool _return_http_data_only: Returns only data field.
@@ -443,45 +426,41 @@ class KeytabsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-        params = {k: v for k, v in six.iteritems(locals()) if v is not None}
-
-        # Convert the filter into a string
-        if params.get('filter'):
-            params['filter'] = str(params['filter'])
-        if params.get('sort'):
-            params['sort'] = [str(_x) for _x in params['sort']]
-        # Assign a value to X-Request-Id if it is not specified
-        if params.get('x_request_id') is None:
-            params['x_request_id'] = str(uuid.uuid4())
         # verify the required parameter 'keytab_file' is set
         if keytab_file is None:
             raise TypeError("Missing the required parameter `keytab_file` when calling `api20_keytabs_upload_post`")
 
-        collection_formats = {}
-        path_params = {}
+        collection_formats = _EMPTY_DICT
+        path_params = _EMPTY_DICT
 
         query_params = []
-        if 'name_prefixes' in params:
-            query_params.append(('name_prefixes', params['name_prefixes']))
+        if name_prefixes is not None:
+            query_params.append(('name_prefixes', name_prefixes))
 
         header_params = {}
 
         form_params = []
-        local_var_files = {}
-        if 'keytab_file' in params:
-            form_params.append(('keytab_file', params['keytab_file']))
+        local_var_files = _EMPTY_DICT
+        if isinstance(keytab_file, pathlib.PurePath):
+            # The ApiClient opens file params itself and sends them as file parts
+            local_var_files = {'keytab_file': str(keytab_file)}
+        elif hasattr(keytab_file, 'read'):
+            # An open file is sent as a binary file part. urllib3 encodes
+            # multipart bodies in memory, so its contents are read here.
+            filename = os.path.basename(str(getattr(keytab_file, 'name', 'keytab_file')))
+            form_params.append(('keytab_file', (filename, keytab_file.read(), 'application/octet-stream')))
+        else:
+            form_params.append(('keytab_file', keytab_file))
 
         body_params = None
         # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/octet-stream', 'text/plain'])
+        header_params['Accept'] = self._accept_keytab_file
 
         # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(
-            ['multipart/form-data'])
+        header_params['Content-Type'] = self._content_type_multipart
 
         # Authentication setting
-        auth_settings = ['AuthorizationHeader']
+        auth_settings = _AUTH_SETTINGS
 
         return self.api_client.call_api(
             '/api/2.0/keytabs/upload', 'POST',
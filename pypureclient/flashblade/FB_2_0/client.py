@@ -8397,7 +8397,9 @@ class Client(object):
         Args:
 
             keytab_file (str, required):
-                The keytab file to upload.
+                The keytab file to upload. May also be a file object opened in binary mode,
+                or a pathlib path to the keytab file, which are preferred for keytabs in the
+                native binary format.
             name_prefixes (str, optional):
                 The prefix to use for the names of all Kerberos keytab objects that are being
                 created.
@@ -11,17 +11,13 @@
 """
 
 
-import pprint
-import re
-
-import six
 import typing
 
-from ....properties import Property
+from .... import _model_base
 if typing.TYPE_CHECKING:
     from pypureclient.flashblade.FB_2_10 import models
 
-class FileSession(object):
+class FileSession(_model_base.NullableSwaggerModel):
     """
     Attributes:
       swagger_types (dict): The key is attribute name
@@ -29,7 +25,7 @@ class FileSession(object):
       attribute_map (dict): The key is attribute name
                             and the value is json key in definition.
     """
-    swagger_types = {
+    swagger_types = _model_base.canonical({
         'name': 'str',
         'authentication': 'str',
         'client': 'FixedReferenceNameOnly',
@@ -40,9 +36,9 @@ class FileSession(object):
         'port': 'int',
         'time': 'int',
         'user': 'UserNoId'
-    }
+    })
 
-    attribute_map = {
+    attribute_map = _model_base.canonical({
         'name': 'name',
         'authentication': 'authentication',
         'client': 'client',
@@ -53,10 +49,13 @@ class FileSession(object):
         'port': 'port',
         'time': 'time',
         'user': 'user'
-    }
+    })
+
+    _ATTRS = tuple(attribute_map)
+    _ATTR_SET = frozenset(attribute_map)
 
-    required_args = {
-    }
+    required_args = _model_base.canonical({
+    })
 
     def __init__(
         self,
@@ -84,82 +83,24 @@ class FileSession(object):
             time (int): Current time in milliseconds since UNIX epoch.
             user (UserNoId): The user who has created the session.
         """
+        fields = self.__dict__
         if name is not None:
-            self.name = name
+            fields['name'] = name
         if authentication is not None:
-            self.authentication = authentication
+            fields['authentication'] = authentication
         if client is not None:
-            self.client = client
+            fields['client'] = client
         if connection_time is not None:
-            self.connection_time = connection_time
+            fields['connection_time'] = connection_time
         if idle_time is not None:
-            self.idle_time = idle_time
+            fields['idle_time'] = idle_time
         if opens is not None:
-            self.opens = opens
+            fields['opens'] = opens
         if protocol is not None:
-            self.protocol = protocol
+            fields['protocol'] = protocol
         if port is not None:
-            self.port = port
+            fields['port'] = port
         if time is not None:
-            self.time = time
+            fields['time'] = time
         if user is not None:
-            self.user = user
-
-    def __setattr__(self, key, value):
-        if key not in self.attribute_map:
-            raise KeyError("Invalid key `{}` for `FileSession`".format(key))
-        self.__dict__[key] = value
-
-    def __getattribute__(self, item):
-        value = object.__getattribute__(self, item)
-        if isinstance(value, Property):
-            return None
-        else:
-            return value
-
-    def to_dict(self):
-        """Returns the model properties as a dict"""
-        result = {}
-
-        for attr, _ in six.iteritems(self.swagger_types):
-            if hasattr(self, attr):
-                value = getattr(self, attr)
-                if isinstance(value, list):
-                    result[attr] = list(map(
-                        lambda x: x.to_dict() if hasattr(x, "to_dict") else x,
-                        value
-                    ))
-                elif hasattr(value, "to_dict"):
-                    result[attr] = value.to_dict()
-                elif isinstance(value, dict):
-                    result[attr] = dict(map(
-                        lambda item: (item[0], item[1].to_dict())
-                        if hasattr(item[1], "to_dict") else item,
-                        value.items()
-                    ))
-                else:
-                    result[attr] = value
-        if issubclass(FileSession, dict):
-            for key, value in self.items():
-                result[key] = value
-
-        return result
-
-    def to_str(self):
-        """Returns the string representation of the model"""
-        return pprint.pformat(self.to_dict())
-
-    def __repr__(self):
-        """For `print` and `pprint`"""
-        return self.to_str()
-
-    def __eq__(self, other):
-        """Returns true if both objects are equal"""
-        if not isinstance(other, FileSession):
-            return False
-
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other):
-        """Returns true if both objects are not equal"""
-        return not self == other
+            fields['user'] = user
@@ -11,17 +11,13 @@
 """
 
 
-import pprint
-import re
-
-import six
 import typing
 
-from ....properties import Property
+from .... import _model_base
 if typing.TYPE_CHECKING:
     from pypureclient.flashblade.FB_2_10 import models
 
-class NfsExportPolicyRuleBase(object):
+class NfsExportPolicyRuleBase(_model_base.NullableSwaggerModel):
     """
     Attributes:
       swagger_types (dict): The key is attribute name
@@ -29,7 +25,7 @@ class NfsExportPolicyRuleBase(object):
       attribute_map (dict): The key is attribute name
                             and the value is json key in definition.
     """
-    swagger_types = {
+    swagger_types = _model_base.canonical({
         'name': 'str',
         'id': 'str',
         'access': 'str',
@@ -43,9 +39,9 @@ class NfsExportPolicyRuleBase(object):
         'permission': 'str',
         'secure': 'bool',
         'security': 'list[str]'
-    }
+    })
 
-    attribute_map = {
+    attribute_map = _model_base.canonical({
         'name': 'name',
         'id': 'id',
         'access': 'access',
@@ -59,10 +55,13 @@ class NfsExportPolicyRuleBase(object):
         'permission': 'permission',
         'secure': 'secure',
         'security': 'security'
-    }
+    })
+
+    _ATTRS = tuple(attribute_map)
+    _ATTR_SET = frozenset(attribute_map)
 
-    required_args = {
-    }
+    required_args = _model_base.canonical({
+    })
 
     def __init__(
         self,
@@ -96,88 +95,30 @@ class NfsExportPolicyRuleBase(object):
             secure (bool): If `true`, prevents NFS access to client connections coming from non-reserved ports. Applies to NFSv3, NFSv4.1, and auxiliary protocols MOUNT and NLM. If `false`, allows NFS access to client connections coming from non-reserved ports. Applies to NFSv3, NFSv4.1, and auxiliary protocols MOUNT and NLM. The default is `false` if not specified.
             security (list[str]): The security flavors to use for accessing files on this mount point.  If the server does not support the requested flavor, the mount operation fails. If `sys`, trusts the client to specify user's identity. If `krb5`, provides cryptographic proof of a user's identity in each RPC request. This provides  strong verification of the identity of users accessing data on the server. Note that additional configuration besides adding this mount option is required in order to enable Kerberos security. If `krb5i`, adds integrity checking to krb5, to ensure the data has not been tampered with. If `krb5p`, adds integrity checking and encryption to krb5. This is the most secure setting, but it also involves the most performance overhead. The default is `sys` if not specified.
         """
+        fields = self.__dict__
         if name is not None:
-            self.name = name
+            fields['name'] = name
         if id is not None:
-            self.id = id
+            fields['id'] = id
         if access is not None:
-            self.access = access
+            fields['access'] = access
         if anongid is not None:
-            self.anongid = anongid
+            fields['anongid'] = anongid
         if anonuid is not None:
-            self.anonuid = anonuid
+            fields['anonuid'] = anonuid
         if atime is not None:
-            self.atime = atime
+            fields['atime'] = atime
         if client is not None:
-            self.client = client
+            fields['client'] = client
         if fileid_32bit is not None:
-            self.fileid_32bit = fileid_32bit
+            fields['fileid_32bit'] = fileid_32bit
         if policy is not None:
-            self.policy = policy
+            fields['policy'] = policy
         if policy_version is not None:
-            self.policy_version = policy_version
+            fields['policy_version'] = policy_version
         if permission is not None:
-            self.permission = permission
+            fields['permission'] = permission
         if secure is not None:
-            self.secure = secure
+            fields['secure'] = secure
         if security is not None:
-            self.security = security
-
-    def __setattr__(self, key, value):
-        if key not in self.attribute_map:
-            raise KeyError("Invalid key `{}` for `NfsExportPolicyRuleBase`".format(key))
-        self.__dict__[key] = value
-
-    def __getattribute__(self, item):
-        value = object.__getattribute__(self, item)
-        if isinstance(value, Property):
-            return None
-        else:
-            return value
-
-    def to_dict(self):
-        """Returns the model properties as a dict"""
-        result = {}
-
-        for attr, _ in six.iteritems(self.swagger_types):
-            if hasattr(self, attr):
-                value = getattr(self, attr)
-                if isinstance(value, list):
-                    result[attr] = list(map(
-                        lambda x: x.to_dict() if hasattr(x, "to_dict") else x,
-                        value
-                    ))
-                elif hasattr(value, "to_dict"):
-                    result[attr] = value.to_dict()
-                elif isinstance(value, dict):
-                    result[attr] = dict(map(
-                        lambda item: (item[0], item[1].to_dict())
-                        if hasattr(item[1], "to_dict") else item,
-                        value.items()
-                    ))
-                else:
-                    result[attr] = value
-        if issubclass(NfsExportPolicyRuleBase, dict):
-            for key, value in self.items():
-                result[key] = value
-
-        return result
-
-    def to_str(self):
-        """Returns the string representation of the model"""
-        return pprint.pformat(self.to_dict())
-
-    def __repr__(self):
-        """For `print` and `pprint`"""
-        return self.to_str()
-
-    def __eq__(self, other):
-        """Returns true if both objects are equal"""
-        if not isinstance(other, NfsExportPolicyRuleBase):
-            return False
-
-        return self.__dict__ == other.__dict__
-
-    def __ne__(self, other):
-        """Returns true if both objects are not equal"""
-        return not self == other
+            fields['security'] = security
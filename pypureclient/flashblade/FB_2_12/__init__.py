@@ -2,8 +2,9 @@ from __future__ import absolute_import
 import os
 
 from .client import Client
+from ... import _model_base
 from ...exceptions import PureError
-from ...properties import Property, Filter
+from ...properties import Property, NullableModelProperty, Filter
 from ...responses import ValidResponse, ErrorResponse, ApiError, ResponseHeaders
 
 from .models.active_directory_directory_servers import ActiveDirectoryDirectoryServers
@@ -242,8 +243,12 @@ from .models.policy_patch import PolicyPatch
 
 
 def add_properties(model):
+    # Only the NullableSwaggerModel subclasses read their attributes without a
+    # __getattribute__ override, the generated models still expect a plain
+    # Property on the class
+    property_class = NullableModelProperty if issubclass(model, _model_base.NullableSwaggerModel) else Property
     for name, value in model.attribute_map.items():
-        setattr(model, name, Property(value))
+        setattr(model, name, property_class(value))
 
 
 CLASSES_TO_ADD_PROPS = [
@@ -11,21 +11,26 @@
 """
 
 
-from __future__ import absolute_import
-
-import re
-
-# python 2 and python 3 compatibility library
-import six
-import uuid
-from typing import List, Optional
+import typing
 
 from .. import models
+if typing.TYPE_CHECKING:
+    from typing import List, Optional
+
+# The ApiClient only iterates the authentication settings, so every request
+# passes this one tuple
+_AUTH_SETTINGS = ('AuthorizationHeader',)
 
 class LifecycleRulesApi(object):
 
     def __init__(self, api_client):
         self.api_client = api_client
+        # The accepted and sent media types are fixed per endpoint, so the
+        # headers are negotiated once instead of on every request
+        self._accept_json = api_client.select_header_accept(
+            ['application/json'])
+        self._content_type_json = api_client.select_header_content_type(
+            ['application/json'])
 
     def api213_lifecycle_rules_delete_with_http_info(
         self,
@@ -72,32 +77,22 @@ class LifecycleRulesApi(object):
         if names is not None:
             if not isinstance(names, list):
                 names = [names]
-        params = {k: v for k, v in six.iteritems(locals()) if v is not None}
-
-        # Convert the filter into a string
-        if params.get('filter'):
-            params['filter'] = str(params['filter'])
-        if params.get('sort'):
-            params['sort'] = [str(_x) for _x in params['sort']]
-        # Assign a value to X-Request-Id if it is not specified
-        if params.get('x_request_id') is None:
-            params['x_request_id'] = str(uuid.uuid4())
 
         collection_formats = {}
         path_params = {}
 
         query_params = []
-        if 'bucket_ids' in params:
-            query_params.append(('bucket_ids', params['bucket_ids']))
+        if bucket_ids is not None:
+            query_params.append(('bucket_ids', bucket_ids))
             collection_formats['bucket_ids'] = 'csv'
-        if 'bucket_names' in params:
-            query_params.append(('bucket_names', params['bucket_names']))
+        if bucket_names is not None:
+            query_params.append(('bucket_names', bucket_names))
             collection_formats['bucket_names'] = 'csv'
-        if 'ids' in params:
-            query_params.append(('ids', params['ids']))
+        if ids is not None:
+            query_params.append(('ids', ids))
             collection_formats['ids'] = 'csv'
-        if 'names' in params:
-            query_params.append(('names', params['names']))
+        if names is not None:
+            query_params.append(('names', names))
             collection_formats['names'] = 'csv'
 
         header_params = {}
@@ -107,15 +102,13 @@ class LifecycleRulesApi(object):
 
         body_params = None
         # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])
+        header_params['Accept'] = self._accept_json
 
         # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(
-            ['application/json'])
+        header_params['Content-Type'] = self._content_type_json
 
         # Authentication setting
-        auth_settings = ['AuthorizationHeader']
+        auth_settings = _AUTH_SETTINGS
 
         return self.api_client.call_api(
             '/api/2.13/lifecycle-rules', 'DELETE',
@@ -192,47 +185,43 @@ class LifecycleRulesApi(object):
         if sort is not None:
             if not isinstance(sort, list):
                 sort = [sort]
-        params = {k: v for k, v in six.iteritems(locals()) if v is not None}
 
         # Convert the filter into a string
-        if params.get('filter'):
-            params['filter'] = str(params['filter'])
-        if params.get('sort'):
-            params['sort'] = [str(_x) for _x in params['sort']]
-        # Assign a value to X-Request-Id if it is not specified
-        if params.get('x_request_id') is None:
-            params['x_request_id'] = str(uuid.uuid4())
-
-        if 'limit' in params and params['limit'] < 0:
+        if filter:
+            filter = str(filter)
+        if sort:
+            sort = [str(_x) for _x in sort]
+
+        if limit is not None and limit < 0:
             raise ValueError("Invalid value for parameter `limit` when calling `api213_lifecycle_rules_get`, must be a value greater than or equal to `0`")
-        if 'offset' in params and params['offset'] < 0:
+        if offset is not None and offset < 0:
             raise ValueError("Invalid value for parameter `offset` when calling `api213_lifecycle_rules_get`, must be a value greater than or equal to `0`")
         collection_formats = {}
         path_params = {}
 
         query_params = []
-        if 'bucket_ids' in params:
-            query_params.append(('bucket_ids', params['bucket_ids']))
+        if bucket_ids is not None:
+            query_params.append(('bucket_ids', bucket_ids))
             collection_formats['bucket_ids'] = 'csv'
-        if 'bucket_names' in params:
-            query_params.append(('bucket_names', params['bucket_names']))
+        if bucket_names is not None:
+            query_params.append(('bucket_names', bucket_names))
             collection_formats['bucket_names'] = 'csv'
-        if 'continuation_token' in params:
-            query_params.append(('continuation_token', params['continuation_token']))
-        if 'filter' in params:
-            query_params.append(('filter', params['filter']))
-        if 'ids' in params:
-            query_params.append(('ids', params['ids']))
+        if continuation_token is not None:
+            query_params.append(('continuation_token', continuation_token))
+        if filter is not None:
+            query_params.append(('filter', filter))
+        if ids is not None:
+            query_params.append(('ids', ids))
             collection_formats['ids'] = 'csv'
-        if 'limit' in params:
-            query_params.append(('limit', params['limit']))
-        if 'names' in params:
-            query_params.append(('names', params['names']))
+        if limit is not None:
+            query_params.append(('limit', limit))
+        if names is not None:
+            query_params.append(('names', names))
             collection_formats['names'] = 'csv'
-        if 'offset' in params:
-            query_params.append(('offset', params['offset']))
-        if 'sort' in params:
-            query_params.append(('sort', params['sort']))
+        if offset is not None:
+            query_params.append(('offset', offset))
+        if sort is not None:
+            query_params.append(('sort', sort))
             collection_formats['sort'] = 'csv'
 
         header_params = {}
@@ -242,15 +231,13 @@ class LifecycleRulesApi(object):
 
         body_params = None
         # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])
+        header_params['Accept'] = self._accept_json
 
         # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(
-            ['application/json'])
+        header_params['Content-Type'] = self._content_type_json
 
         # Authentication setting
-        auth_settings = ['AuthorizationHeader']
+        auth_settings = _AUTH_SETTINGS
 
         return self.api_client.call_api(
             '/api/2.13/lifecycle-rules', 'GET',
@@ -318,16 +305,6 @@ class LifecycleRulesApi(object):
         if names is not None:
             if not isinstance(names, list):
                 names = [names]
-        params = {k: v for k, v in six.iteritems(locals()) if v is not None}
-
-        # Convert the filter into a string
-        if params.get('filter'):
-            params['filter'] = str(params['filter'])
-        if params.get('sort'):
-            params['sort'] = [str(_x) for _x in params['sort']]
-        # Assign a value to X-Request-Id if it is not specified
-        if params.get('x_request_id') is None:
-            params['x_request_id'] = str(uuid.uuid4())
         # verify the required parameter 'lifecycle' is set
         if lifecycle is None:
             raise TypeError("Missing the required parameter `lifecycle` when calling `api213_lifecycle_rules_patch`")
@@ -336,20 +313,20 @@ class LifecycleRulesApi(object):
         path_params = {}
 
         query_params = []
-        if 'bucket_ids' in params:
-            query_params.append(('bucket_ids', params['bucket_ids']))
+        if bucket_ids is not None:
+            query_params.append(('bucket_ids', bucket_ids))
             collection_formats['bucket_ids'] = 'csv'
-        if 'bucket_names' in params:
-            query_params.append(('bucket_names', params['bucket_names']))
+        if bucket_names is not None:
+            query_params.append(('bucket_names', bucket_names))
             collection_formats['bucket_names'] = 'csv'
-        if 'ids' in params:
-            query_params.append(('ids', params['ids']))
+        if ids is not None:
+            query_params.append(('ids', ids))
             collection_formats['ids'] = 'csv'
-        if 'names' in params:
-            query_params.append(('names', params['names']))
+        if names is not None:
+            query_params.append(('names', names))
             collection_formats['names'] = 'csv'
-        if 'confirm_date' in params:
-            query_params.append(('confirm_date', params['confirm_date']))
+        if confirm_date is not None:
+            query_params.append(('confirm_date', confirm_date))
 
         header_params = {}
 
@@ -357,18 +334,16 @@ class LifecycleRulesApi(object):
         local_var_files = {}
 
         body_params = None
-        if 'lifecycle' in params:
-            body_params = params['lifecycle']
+        if lifecycle is not None:
+            body_params = lifecycle
         # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])
+        header_params['Accept'] = self._accept_json
 
         # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(
-            ['application/json'])
+        header_params['Content-Type'] = self._content_type_json
 
         # Authentication setting
-        auth_settings = ['AuthorizationHeader']
+        auth_settings = _AUTH_SETTINGS
 
         return self.api_client.call_api(
             '/api/2.13/lifecycle-rules', 'PATCH',
@@ -416,16 +391,6 @@ class LifecycleRulesApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-        params = {k: v for k, v in six.iteritems(locals()) if v is not None}
-
-        # Convert the filter into a string
-        if params.get('filter'):
-            params['filter'] = str(params['filter'])
-        if params.get('sort'):
-            params['sort'] = [str(_x) for _x in params['sort']]
-        # Assign a value to X-Request-Id if it is not specified
-        if params.get('x_request_id') is None:
-            params['x_request_id'] = str(uuid.uuid4())
         # verify the required parameter 'rule' is set
         if rule is None:
             raise TypeError("Missing the required parameter `rule` when calling `api213_lifecycle_rules_post`")
@@ -434,8 +399,8 @@ class LifecycleRulesApi(object):
         path_params = {}
 
         query_params = []
-        if 'confirm_date' in params:
-            query_params.append(('confirm_date', params['confirm_date']))
+        if confirm_date is not None:
+            query_params.append(('confirm_date', confirm_date))
 
         header_params = {}
 
@@ -443,18 +408,16 @@ class LifecycleRulesApi(object):
         local_var_files = {}
 
         body_params = None
-        if 'rule' in params:
-            body_params = params['rule']
+        if rule is not None:
+            body_params = rule
         # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])
+        header_params['Accept'] = self._accept_json
 
         # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(
-            ['application/json'])
+        header_params['Content-Type'] = self._content_type_json
 
         # Authentication setting
-        auth_settings = ['AuthorizationHeader']
+        auth_settings = _AUTH_SETTINGS
 
         return self.api_client.call_api(
             '/api/2.13/lifecycle-rules', 'POST',
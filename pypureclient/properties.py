@@ -213,6 +213,59 @@ class Property(object):
         return self.value
 
 
+class ModelProperty(Property):
+    """
+    A Property installed as a class attribute of a `_model_base.SwaggerModel`
+    subclass. Reading it from the model class returns the Property itself so
+    it can be used in filters and sorts. Reading it from a model instance
+    means the attribute was never set on that instance, so an AttributeError
+    is raised instead.
+    """
+
+    def __get__(self, instance, owner):
+        """
+        Resolve the Property for class or instance access.
+
+        Args:
+            instance (object): The model instance, or None for class access.
+            owner (type): The model class.
+
+        Returns:
+            Property
+
+        Raises:
+            AttributeError: If accessed through a model instance.
+        """
+        if instance is None:
+            return self
+        raise AttributeError(self.value)
+
+
+class NullableModelProperty(Property):
+    """
+    A Property installed as a class attribute of a
+    `_model_base.NullableSwaggerModel` subclass, whose unset attributes read as
+    None. Reading it from the model class returns the Property itself so it can
+    be used in filters and sorts. Reading it from a model instance means the
+    attribute was never set on that instance, so None is returned instead.
+    """
+
+    def __get__(self, instance, owner):
+        """
+        Resolve the Property for class or instance access.
+
+        Args:
+            instance (object): The model instance, or None for class access.
+            owner (type): The model class.
+
+        Returns:
+            Property, or None if accessed through a model instance.
+        """
+        if instance is None:
+            return self
+        return None
+
+
 class Filter(object):
     """
     A Filter object models a filter string by keeping track of operations
@@ -61,6 +61,26 @@ def _create_response_headers(headers):
     return response_headers
 
 
+def _items_to_dicts(items):
+    """
+    Convert a list of models to a list of dictionaries. When every model is of
+    the same class and that class supports batch conversion, they are converted
+    in a single call.
+
+    Args:
+        items (list): The models to convert.
+
+    Returns:
+        list[dict]
+    """
+    classes = set(type(item) for item in items)
+    if len(classes) == 1:
+        to_dicts = getattr(classes.pop(), 'to_dicts', None)
+        if to_dicts is not None:
+            return to_dicts(items)
+    return [item.to_dict() for item in items]
+
+
 class Response(object):
     """
     An abstract response that is extended to a valid or error response.
@@ -120,13 +140,13 @@ class ValidResponse(Response):
         """
         new_dict = dict(self.__dict__)
         if isinstance(self.items, ItemIterator):
-            new_dict['items'] = [item.to_dict() for item in list(self.items)]
+            new_dict['items'] = _items_to_dicts(list(self.items))
 
         new_dict['headers'] = (self.headers.to_dict
                                if self.headers is not None else None)
 
         if hasattr(self, 'total') and isinstance(self.total, list):
-            new_dict['total'] = [item.to_dict() for item in self.total]
+            new_dict['total'] = _items_to_dicts(self.total)
         if hasattr(self, 'errors') and isinstance(self.errors, list):
             new_dict['errors'] = [item.to_dict() for item in self.errors]
         return new_dict
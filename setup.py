@@ -4,9 +4,13 @@
 '''
 Pure Storage Python clients for FlashArray, FlashBlade, and Pure1 APIs
 '''
+import os
+import py_compile
 import sys
+from importlib.util import cache_from_source
 
 from setuptools import setup, find_packages  # noqa: H301
+from setuptools.command.build_py import build_py
 
 NAME = 'py-pure-client'
 VERSION = '1.62.0'
@@ -25,6 +29,102 @@ REQUIRES = [
 if sys.version_info < (3, 5):
     REQUIRES.append('typing >=3.7.4.1, <= 3.7.4.3')
 
+# Model and API modules on the request and response hot path, and the helpers
+# the models share for conversion to dicts. When PYPURECLIENT_ENABLE_CYTHON is
+# set they are compiled to C extensions, and the build fails if Cython is
+# missing. The pure-Python sources are always installed and are used whenever
+# the compiled modules are not present.
+CYTHON_MODULES = [
+    'pypureclient/_model_base.py',
+    'pypureclient/flasharray/FA_2_40/models/active_directory_post.py',
+    'pypureclient/flasharray/FA_2_40/models/audit.py',
+    'pypureclient/flasharray/FA_2_40/models/networkinterfacepost_eth.py',
+    'pypureclient/flasharray/FA_2_40/models/pod.py',
+    'pypureclient/flasharray/FA_2_40/models/policy_password.py',
+    'pypureclient/flasharray/FA_2_40/models/preset_workload_constraints_string.py',
+    'pypureclient/flasharray/FA_2_40/models/remote_volume_snapshot.py',
+    'pypureclient/flasharray/FA_2_40/models/space.py',
+    'pypureclient/flasharray/FA_2_40/models/test_result_with_resource_with_id.py',
+    'pypureclient/flashblade/FB_2_0/api/keytabs_api.py',
+    'pypureclient/flashblade/FB_2_10/models/file_session.py',
+    'pypureclient/flashblade/FB_2_10/models/nfs_export_policy_rule_base.py',
+    'pypureclient/flashblade/FB_2_12/models/file_session.py',
+    'pypureclient/flashblade/FB_2_12/models/nfs_export_policy_rule_base.py',
+    'pypureclient/flashblade/FB_2_13/api/lifecycle_rules_api.py',
+]
+
+
+def env_flag(name):
+    return os.environ.get(name, '').lower() in ('1', 'true', 'yes')
+
+
+def cython_extensions():
+    if not env_flag('PYPURECLIENT_ENABLE_CYTHON'):
+        return []
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        # pip's isolated build environment does not have Cython, and falling
+        # back would quietly give a pure-Python install despite the opt-in
+        raise RuntimeError('PYPURECLIENT_ENABLE_CYTHON is set but Cython cannot be imported; '
+                           'install Cython and build with pip --no-build-isolation')
+    return cythonize(CYTHON_MODULES,
+                     compiler_directives={'language_level': 3,
+                                          'boundscheck': False})
+
+
+# When PYPURECLIENT_OPTIMIZE_BYTECODE is set, the build also byte-compiles the
+# package at optimization level 2, so interpreters running with -OO load
+# prebuilt, docstring-free .opt-2.pyc files instead of compiling thousands of
+# generated modules on first import. The sources are still shipped, so regular
+# interpreters keep their docstrings.
+class build_py_hash_based(build_py):
+    """
+    build_py that writes the optimized bytecode as hash-based pycs (PEP 552).
+
+    Timestamp-based pycs are validated against the source mtime, which pip
+    does not preserve when it installs a wheel, so they would be recompiled on
+    first import. Checked hash-based pycs stay valid wherever the unchanged
+    source is installed.
+    """
+
+    def byte_compile(self, files):
+        if sys.dont_write_bytecode:
+            self.warn('byte-compiling is disabled, skipping.')
+            return
+        prefix = os.path.join(self.build_lib, '')
+        for source in files:
+            if not source.endswith('.py'):
+                continue
+            py_compile.compile(source,
+                               cfile=cache_from_source(source, optimization=self.optimize),
+                               dfile=source[len(prefix):],
+                               doraise=True,
+                               optimize=self.optimize,
+                               invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH)
+
+
+def optimize_bytecode():
+    if not env_flag('PYPURECLIENT_OPTIMIZE_BYTECODE'):
+        return False
+    if not hasattr(py_compile, 'PycInvalidationMode'):
+        raise RuntimeError('PYPURECLIENT_OPTIMIZE_BYTECODE needs Python 3.7 or later '
+                           'to write hash-based bytecode')
+    return True
+
+
+def build_options():
+    if not optimize_bytecode():
+        return {}
+    return {'build_py': {'optimize': 2}}
+
+
+def build_commands():
+    if not optimize_bytecode():
+        return {}
+    return {'build_py': build_py_hash_based}
+
+
 readme = open('README.md', 'r')
 README_TEXT = readme.read()
 readme.close()
@@ -42,6 +142,9 @@ setup(
     license_files = ('LICENSE.txt',),
     install_requires=REQUIRES,
     packages=find_packages(),
+    ext_modules=cython_extensions(),
+    options=build_options(),
+    cmdclass=build_commands(),
     include_package_data=True,
     long_description=README_TEXT,
     long_description_content_type='text/markdown'
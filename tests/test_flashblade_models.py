@@ -0,0 +1,44 @@
+import pytest
+
+from pypureclient.flashblade.FB_2_10 import models as models_2_10
+from pypureclient.flashblade.FB_2_12 import models as models_2_12
+from pypureclient.properties import NullableModelProperty, Property
+
+MODELS = [models_2_10, models_2_12]
+
+
+@pytest.mark.parametrize('models', MODELS)
+def test_descriptor_only_on_nullable_swagger_models(models):
+    for model in (models.FileSession, models.NfsExportPolicyRuleBase):
+        assert isinstance(model.name, NullableModelProperty)
+    generated = models.FileSystem.name
+    assert isinstance(generated, Property)
+    assert not isinstance(generated, NullableModelProperty)
+
+
+@pytest.mark.parametrize('models', MODELS)
+def test_unset_attribute_reads_none(models):
+    session = models.FileSession(name='s')
+    assert session.name == 's'
+    assert session.client is None
+    assert session['client'] is None
+
+
+@pytest.mark.parametrize('models', MODELS)
+def test_to_dict_reports_every_attribute(models):
+    for model in (models.FileSession, models.NfsExportPolicyRuleBase):
+        result = model(name='n').to_dict()
+        assert list(result) == list(model.attribute_map)
+        assert result['name'] == 'n'
+        assert all(value is None for key, value in result.items() if key != 'name')
+
+
+@pytest.mark.parametrize('models', MODELS)
+def test_unknown_attribute_raises_key_error(models):
+    rule = models.NfsExportPolicyRuleBase()
+    with pytest.raises(KeyError):
+        rule.unknown = 1
+    with pytest.raises(KeyError):
+        rule['unknown']
+    with pytest.raises(TypeError):
+        models.NfsExportPolicyRuleBase(unknown=1)
@@ -0,0 +1,71 @@
+import pathlib
+
+import pytest
+
+from pypureclient.flashblade.FB_2_0.api.keytabs_api import KeytabsApi
+from pypureclient.flashblade.FB_2_0.api_client import ApiClient
+from pypureclient.flashblade.FB_2_0.configuration import Configuration
+
+
+class _Sent(Exception):
+    pass
+
+
+class _RecordingApiClient(ApiClient):
+    """Stops each request at the transport and keeps what would be sent."""
+
+    def request(self, method, url, **kwargs):
+        self.sent = dict(kwargs, method=method, url=url)
+        raise _Sent()
+
+
+@pytest.fixture
+def api():
+    configuration = Configuration()
+    configuration.host = 'https://array'
+    return KeytabsApi(_RecordingApiClient(configuration))
+
+
+def _send(call, **kwargs):
+    with pytest.raises(_Sent):
+        call(**kwargs)
+    return call.__self__.api_client.sent
+
+
+def test_upload_file_object(api, tmp_path):
+    keytab = tmp_path / 'array.keytab'
+    keytab.write_bytes(b'\x05\x02keytab')
+    with keytab.open('rb') as f:
+        sent = _send(api.api20_keytabs_upload_post_with_http_info, keytab_file=f)
+    assert sent['url'] == 'https://array/api/2.0/keytabs/upload'
+    assert sent['post_params'] == [('keytab_file', ('array.keytab', b'\x05\x02keytab', 'application/octet-stream'))]
+
+
+def test_upload_path(api, tmp_path):
+    keytab = tmp_path / 'array.keytab'
+    keytab.write_bytes(b'\x05\x02keytab')
+    sent = _send(api.api20_keytabs_upload_post_with_http_info, keytab_file=pathlib.Path(str(keytab)))
+    assert sent['post_params'] == [('keytab_file', ('array.keytab', b'\x05\x02keytab', 'application/octet-stream'))]
+
+
+def test_upload_str_is_sent_as_form_value(api):
+    sent = _send(api.api20_keytabs_upload_post_with_http_info, keytab_file='BQIAAA==')
+    assert sent['post_params'] == [('keytab_file', 'BQIAAA==')]
+
+
+def test_get_drops_repeated_ids_and_names_in_order(api):
+    sent = _send(api.api20_keytabs_get_with_http_info, ids=['b', 'a', 'b', 'c', 'a'], names=['n', 'n'])
+    assert sent['query_params'] == [('ids', 'b,a,c'), ('names', 'n')]
+
+
+def test_delete_drops_repeated_ids_and_names_in_order(api):
+    sent = _send(api.api20_keytabs_delete_with_http_info, ids=['b', 'a', 'b'], names=['y', 'x', 'x'])
+    assert sent['method'] == 'DELETE'
+    assert sent['query_params'] == [('ids', 'b,a'), ('names', 'y,x')]
+
+
+def test_single_string_ids_and_names(api):
+    sent = _send(api.api20_keytabs_get_with_http_info, ids='abc', names='n')
+    assert sent['query_params'] == [('ids', 'abc'), ('names', 'n')]
+    sent = _send(api.api20_keytabs_delete_with_http_info, ids='abc')
+    assert sent['query_params'] == [('ids', 'abc')]
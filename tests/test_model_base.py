@@ -0,0 +1,114 @@
+import pytest
+
+from pypureclient import _model_base
+from pypureclient.flasharray.FA_2_40 import models
+from pypureclient.properties import ModelProperty, Property
+
+
+def test_class_access_returns_property():
+    # Filters and sorts are built from the class attributes
+    for model in (models.Pod, models.Volume):
+        prop = model.name
+        assert isinstance(prop, Property)
+        assert str(prop == 'x') == "name='x'"
+
+
+def test_descriptor_only_on_models_without_override():
+    assert isinstance(models.Pod.name, ModelProperty)
+    assert not isinstance(models.Volume.name, ModelProperty)
+
+
+def test_unset_attribute_raises_attribute_error():
+    for model in (models.Pod, models.Volume):
+        assert not hasattr(model(name='n'), 'id')
+
+
+def test_getitem_unset_key_returns_class_property():
+    for model in (models.Pod, models.Volume):
+        value = model(name='n')['id']
+        assert isinstance(value, Property)
+        assert value.value == 'id'
+
+
+def test_dict_conversion():
+    for model in (models.Pod, models.Volume):
+        result = dict(model(name='n'))
+        assert result['name'] == 'n'
+        assert set(result) == set(model.attribute_map)
+
+
+def test_to_columns():
+    pods = [models.Pod(name='a', footprint=1), models.Pod(name='b')]
+    columns = models.Pod.to_columns(pods)
+    assert list(columns) == list(models.Pod._ATTRS)
+    assert columns['name'] == ['a', 'b']
+    assert columns['footprint'] == [1, None]
+    assert columns['id'] == [None, None]
+
+
+def test_to_columns_empty():
+    assert models.Pod.to_columns([]) == {attr: [] for attr in models.Pod._ATTRS}
+
+
+def test_canonical_shares_equal_mappings():
+    source = {'id': 'str', 'name': 'str'}
+    shared = _model_base.canonical(source)
+    assert _model_base.canonical({'id': 'str', 'name': 'str'}) is shared
+    assert _model_base.canonical({'name': 'str', 'id': 'str'}) is not shared
+    source['id'] = 'int'
+    assert shared['id'] == 'str'
+    assert models.Audit.required_args is models.TestResultWithResourceWithId.required_args
+
+
+def test_canonical_is_read_only():
+    shared = _model_base.canonical({'id': 'str'})
+    with pytest.raises(TypeError):
+        shared['id'] = 'int'
+    with pytest.raises(TypeError):
+        del shared['id']
+    with pytest.raises(TypeError):
+        models.Pod.swagger_types['id'] = 'int'
+
+
+class _Response(object):
+
+    def __init__(self, data):
+        self.data = data
+
+
+def test_deserialize_skips_validators():
+    from pypureclient.flasharray.FA_2_40.api_client import ApiClient
+    from pypureclient.flasharray.FA_2_40.configuration import Configuration
+
+    client = ApiClient(Configuration())
+    pod = client.deserialize(_Response('{"name": "p", "footprint": -1, "arrays": [{"name": "a"}]}'), 'Pod')
+    assert pod.footprint == -1
+    assert isinstance(pod.arrays[0], models.PodArrayStatus)
+    assert pod.to_dict() == {'name': 'p', 'footprint': -1, 'arrays': [{'name': 'a'}]}
+    with pytest.raises(ValueError):
+        models.Pod(name='p', footprint=-1)
+    with pytest.raises(ValueError):
+        pod.footprint = -2
+
+
+def test_to_dict_matches_between_init_and_from_trusted():
+    kwargs = {'name': 'p', 'id': '1', 'destroyed': False, 'source': None}
+    built = models.Pod(**kwargs)
+    trusted = models.Pod._from_trusted(kwargs)
+    assert built.to_dict() == trusted.to_dict() == {'name': 'p', 'id': '1', 'destroyed': False}
+    assert built == trusted
+
+
+@pytest.mark.parametrize('model, key, value', [
+    (models.Pod, 'footprint', -1),
+    (models.Pod, 'quota_limit', 4503599627370497),
+    (models.Space, 'replication', -1),
+    (models.Space, 'thin_provisioning', 1.5),
+    (models.PolicyPassword, 'max_login_attempts', 0),
+])
+def test_range_validators(model, key, value):
+    with pytest.raises(ValueError, match='Invalid value for `{}`'.format(key)):
+        model(**{key: value})
+    instance = model()
+    with pytest.raises(ValueError):
+        setattr(instance, key, value)
@@ -0,0 +1,41 @@
+from pypureclient.flasharray.FA_2_40 import models as fa_models
+from pypureclient.flashblade.FB_2_12 import models as fb_models
+from pypureclient.responses import ItemIterator, ValidResponse, _items_to_dicts
+
+
+def _pods():
+    nested = fa_models.Pod(name='p1', footprint=5,
+                           space=fa_models.PodSpace(total_used=1),
+                           arrays=[fa_models.PodArrayStatus(name='a'), fa_models.PodArrayStatus(name='b')])
+    with_dict = fa_models.Pod(name='p2', failover_preferences=[])
+    with_dict['source'] = {'name': 'raw', 'ref': fa_models.Reference(name='r')}
+    return [nested, with_dict, fa_models.Pod()]
+
+
+def _rules():
+    return [fb_models.NfsExportPolicyRuleBase(name='r1', security=['sys', 'krb5'],
+                                              policy=fb_models.FixedReference(name='p')),
+            fb_models.NfsExportPolicyRuleBase()]
+
+
+def test_to_dicts_matches_to_dict():
+    for items in (_pods(), _rules()):
+        expected = [item.to_dict() for item in items]
+        assert type(items[0]).to_dicts(items) == expected
+        assert _items_to_dicts(items) == expected
+    assert _pods()[1].to_dict()['source'] == {'name': 'raw', 'ref': {'name': 'r'}}
+    assert _rules()[1].to_dict()['policy'] is None
+
+
+def test_items_to_dicts_mixed_classes():
+    items = _pods() + _rules() + [fa_models.Reference(name='r')]
+    assert _items_to_dicts(items) == [item.to_dict() for item in items]
+
+
+def test_valid_response_to_dict():
+    pods = _pods()
+    iterator = ItemIterator(None, None, {}, None, len(pods), pods, None, more_items_remaining=False)
+    response = ValidResponse(200, None, len(pods), iterator, None, total=_pods()[:1])
+    result = response.to_dict()
+    assert result['items'] == [pod.to_dict() for pod in _pods()]
+    assert result['total'] == [_pods()[0].to_dict()]
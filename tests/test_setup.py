@@ -0,0 +1,31 @@
+import os
+import struct
+import subprocess
+import sys
+
+import pytest
+
+SETUP_PY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'setup.py')
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason='hash-based pycs need Python 3.7')
+def test_optimized_bytecode_is_hash_based(tmp_path):
+    # setup.py builds whatever packages are in the working directory, so a
+    # one-module package keeps the build short
+    package = tmp_path / 'pkg'
+    package.mkdir()
+    (package / '__init__.py').write_text('"""Docstring."""\n')
+    (tmp_path / 'README.md').write_text('')
+    env = dict(os.environ, PYPURECLIENT_OPTIMIZE_BYTECODE='1')
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    build_lib = tmp_path / 'build'
+    subprocess.check_call([sys.executable, SETUP_PY, '-q', 'build_py', '--build-lib', str(build_lib)],
+                          cwd=str(tmp_path), env=env)
+
+    cache = build_lib / 'pkg' / '__pycache__'
+    tag = sys.implementation.cache_tag
+    assert sorted(p.name for p in cache.iterdir()) == ['__init__.{}.opt-2.pyc'.format(tag)]
+    header = (cache / '__init__.{}.opt-2.pyc'.format(tag)).read_bytes()[:16]
+    # PEP 552 flags word: bit 0 marks a hash-based pyc, bit 1 asks the import
+    # system to check the hash against the source
+    assert struct.unpack('<I', header[4:8])[0] == 0b11